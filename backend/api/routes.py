@@ -53,7 +53,7 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> str:
     if not session:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    return session['username']
+    return session.username
 
 
 # Auth request models
@@ -103,6 +103,9 @@ async def check_mfa(request: MFACheckRequest):
     """
     try:
         result = await auth_manager.complete_mfa(request.challenge_id)
+        if result.get('success'):
+            trading_service.invalidate_login_cache()
+            trading_service.wake_monitor()
         return result
     except HTTPException:
         raise
@@ -119,6 +122,7 @@ async def logout(authorization: Optional[str] = Header(None)):
 
     token = authorization.replace("Bearer ", "")
     success = await auth_manager.logout(token)
+    trading_service.invalidate_login_cache()
 
     return {"success": success}
 
@@ -147,8 +151,8 @@ async def check_session(authorization: Optional[str] = Header(None)):
         return {
             "authenticated": True,
             "limited_mode": False,
-            "username": session.get('username'),
-            "expires_at": session.get('expires_at').isoformat()
+            "username": session.username,
+            "expires_at": session.expires_at.isoformat()
         }
 
     return {"authenticated": False}
@@ -219,11 +223,12 @@ async def get_positions(current_user: str = Depends(get_current_user)) -> List[P
         trading_service.trader.get_all_open_option_positions
     )
 
-    for pos in rh_positions:
-        option_id = pos.get('option_id', f"rh_{pos['ticker']}")
+    # Get settings from DB in one query (filtered by user); missing ones use defaults
+    option_ids = [pos.get('option_id', f"rh_{pos['ticker']}") for pos in rh_positions]
+    db_settings = await db.get_positions_settings(option_ids, current_user)
 
-        # Get settings from DB or use defaults (filtered by user)
-        db_pos = await db.get_position(option_id, current_user)
+    for pos, option_id in zip(rh_positions, option_ids):
+        db_pos = db_settings.get(option_id)
         if db_pos:
             tp = db_pos['take_profit']
             sl = db_pos['stop_loss']
@@ -307,6 +312,9 @@ async def update_take_profit(
         # Update existing position in DB
         await db.update_position(position_id, current_user, {'take_profit': request.value / 100.0})
 
+    # Re-check positions against the new threshold right away
+    trading_service.wake_monitor()
+
     return {"success": True, "message": f"TP updated to {request.value}%"}
 
 
@@ -364,6 +372,9 @@ async def update_stop_loss(
         # Update existing position in DB
         await db.update_position(position_id, current_user, {'stop_loss': request.value / 100.0})
 
+    # Re-check positions against the new threshold right away
+    trading_service.wake_monitor()
+
     return {"success": True, "message": f"SL updated to {request.value}%"}
 
 
@@ -441,7 +452,7 @@ async def analyze_ticker_insight(ticker: str, authorization: Optional[str] = Hea
         else:
             session = await auth_manager.get_session(token)
             if session:
-                current_user = session['username']
+                current_user = session.username
 
     user_settings = None
     if current_user:
@@ -623,6 +634,7 @@ async def place_option_trade(request: dict, current_user: str = Depends(get_curr
                 "source": "bot",
                 "strategy_used": strategy_used
             }, current_user)
+            trading_service.wake_monitor()  # Start monitoring the new position right away
 
             return {
                 "success": True,
@@ -6,6 +6,7 @@ import secrets
 import hashlib
 import json
 import logging
+from dataclasses import dataclass
 from typing import Optional, Dict, TYPE_CHECKING
 from datetime import datetime, timedelta
 import robin_stocks.robinhood as rh
@@ -19,14 +20,33 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Session:
+    """Authenticated web session (mirrors a row of the sessions table)"""
+    username: str
+    device_token: Optional[str]
+    created_at: datetime
+    expires_at: datetime
+    logged_in: bool = True
+
+
+@dataclass(slots=True)
+class MFAChallenge:
+    """Pending login waiting for MFA approval in the Robinhood app"""
+    username: str
+    password: str
+    created_at: datetime
+    expires_at: datetime
+    login_attempted: bool = False  # Set on the first MFA poll
+
+
 class AuthManager:
     """Manages Robinhood authentication and sessions"""
 
     def __init__(self, db: 'Database' = None):
         self.db = db  # Database instance for persistent session storage
-        self.sessions: Dict[str, Dict] = {}  # In-memory cache: session_token -> session_data
-        self.mfa_challenges: Dict[str, Dict] = {}  # challenge_id -> challenge_data
-        self.mfa_login_attempted: Dict[str, bool] = {}  # challenge_id -> whether we've tried login
+        self.sessions: Dict[str, Session] = {}  # In-memory cache: session_token -> session
+        self.mfa_challenges: Dict[str, MFAChallenge] = {}  # challenge_id -> challenge
 
     def create_session_token(self) -> str:
         """Generate a secure session token"""
@@ -52,12 +72,13 @@ class AuthManager:
             challenge_id = self.create_challenge_id()
 
             # Store challenge data for polling
-            self.mfa_challenges[challenge_id] = {
-                'username': username,
-                'password': password,
-                'created_at': datetime.utcnow(),
-                'expires_at': datetime.utcnow() + timedelta(minutes=5)
-            }
+            created_at = datetime.utcnow()
+            self.mfa_challenges[challenge_id] = MFAChallenge(
+                username=username,
+                password=password,
+                created_at=created_at,
+                expires_at=created_at + timedelta(minutes=5)
+            )
 
             logger.info(f"Login request received for {username}, created challenge {challenge_id}")
 
@@ -125,24 +146,24 @@ class AuthManager:
         challenge = self.mfa_challenges[challenge_id]
 
         # Check if expired
-        if datetime.utcnow() > challenge['expires_at']:
+        if datetime.utcnow() > challenge.expires_at:
             del self.mfa_challenges[challenge_id]
             raise HTTPException(status_code=408, detail="MFA challenge expired")
 
         try:
             # Only attempt login once to avoid triggering multiple MFA challenges
-            should_attempt_login = challenge_id not in self.mfa_login_attempted
+            should_attempt_login = not challenge.login_attempted
 
             if should_attempt_login:
                 logger.info(f"First MFA check - attempting login for challenge {challenge_id}")
-                self.mfa_login_attempted[challenge_id] = True
+                challenge.login_attempted = True
 
             # Poll Robinhood to check if MFA was approved
             # This is a blocking operation, so run in thread pool
             result = await asyncio.to_thread(
                 self._check_mfa_approval,
-                challenge['username'],
-                challenge['password'],
+                challenge.username,
+                challenge.password,
                 should_attempt_login
             )
 
@@ -155,35 +176,33 @@ class AuthManager:
                 created_at = datetime.utcnow()
                 expires_at = created_at + timedelta(hours=24)
 
-                session_data = {
-                    'username': challenge['username'],
-                    'device_token': result.get('device_token'),
-                    'created_at': created_at,
-                    'expires_at': expires_at,
-                    'logged_in': True
-                }
+                session = Session(
+                    username=challenge.username,
+                    device_token=result.get('device_token'),
+                    created_at=created_at,
+                    expires_at=expires_at
+                )
 
                 # Save to database for persistence
                 if self.db:
-                    await self.db.conn.execute('''
-                        INSERT INTO sessions (token, username, device_token, created_at, expires_at, logged_in)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        session_token,
-                        challenge['username'],
-                        result.get('device_token'),
-                        created_at.isoformat(),
-                        expires_at.isoformat(),
-                        1
-                    ))
-                    await self.db.conn.commit()
+                    async with self.db.transaction():
+                        await self.db.conn.execute('''
+                            INSERT INTO sessions (token, username, device_token, created_at, expires_at, logged_in)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        ''', (
+                            session_token,
+                            session.username,
+                            session.device_token,
+                            created_at.isoformat(),
+                            expires_at.isoformat(),
+                            1
+                        ))
 
                 # Also cache in memory for performance
-                self.sessions[session_token] = session_data
+                self.sessions[session_token] = session
 
                 # Clean up challenge (safe deletion to avoid race condition)
                 self.mfa_challenges.pop(challenge_id, None)
-                self.mfa_login_attempted.pop(challenge_id, None)
 
                 logger.info(f"MFA success! Created session token: {session_token[:10]}...")
 
@@ -283,18 +302,18 @@ class AuthManager:
             logger.warning(f"MFA check error (returning pending): {str(e)}")
             return {'pending': True}
 
-    async def get_session(self, token: str) -> Optional[Dict]:
+    async def get_session(self, token: str) -> Optional[Session]:
         """Get session data by token (checks database for persistence)"""
         # First check in-memory cache
         if token in self.sessions:
             session = self.sessions[token]
             # Check if expired
-            if datetime.utcnow() > session['expires_at']:
+            if datetime.utcnow() > session.expires_at:
                 # Expired - remove from cache and database
                 del self.sessions[token]
                 if self.db:
-                    await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
-                    await self.db.conn.commit()
+                    async with self.db.transaction():
+                        await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
                 return None
             return session
 
@@ -312,20 +331,20 @@ class AuthManager:
 
                 # Check if expired
                 if datetime.utcnow() > expires_at:
-                    await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
-                    await self.db.conn.commit()
+                    async with self.db.transaction():
+                        await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
                     return None
 
                 # Load into cache
-                session_data = {
-                    'username': row['username'],
-                    'device_token': row['device_token'],
-                    'created_at': datetime.fromisoformat(row['created_at']),
-                    'expires_at': expires_at,
-                    'logged_in': bool(row['logged_in'])
-                }
-                self.sessions[token] = session_data
-                return session_data
+                session = Session(
+                    username=row['username'],
+                    device_token=row['device_token'],
+                    created_at=datetime.fromisoformat(row['created_at']),
+                    expires_at=expires_at,
+                    logged_in=bool(row['logged_in'])
+                )
+                self.sessions[token] = session
+                return session
 
         return None
 
@@ -337,8 +356,8 @@ class AuthManager:
 
         # Remove from database
         if self.db:
-            await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
-            await self.db.conn.commit()
+            async with self.db.transaction():
+                await self.db.conn.execute('DELETE FROM sessions WHERE token = ?', (token,))
 
         # Logout from Robinhood
         try:
@@ -353,14 +372,14 @@ class AuthManager:
         if not token:
             return False
         session = await self.get_session(token)
-        return session is not None and session.get('logged_in', False)
+        return session is not None and session.logged_in
 
     async def restore_session(self, token: str) -> bool:
         """
         Restore Robinhood login from session.
         Call this before making any Robinhood API calls.
         """
-        session = self.get_session(token)
+        session = await self.get_session(token)
 
         if not session:
             return False
@@ -369,7 +388,7 @@ class AuthManager:
             # Re-login with stored credentials
             # In production, you'd use the device token to avoid re-login
             # For now, we rely on the session being valid
-            session['logged_in'] = True
+            session.logged_in = True
             return True
 
         except Exception as e:
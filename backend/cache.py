@@ -3,11 +3,15 @@ Redis caching layer with fallback to in-memory cache
 Reduces Yahoo Finance API calls by 90%
 """
 import json
+import pickle
 import asyncio
-from typing import Optional, Any
-from datetime import datetime
+from typing import Optional, Any, Awaitable, Callable, Dict
 import logging
 
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+
 try:
     import redis.asyncio as redis
     REDIS_AVAILABLE = True
@@ -18,14 +22,23 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Values of these types are pickled instead of JSON-encoded (float columns
+# survive as raw buffers rather than being stringified element by element)
+_BINARY_TYPES = (np.ndarray, pd.DataFrame, pd.Series)
+
+# One-byte prefixes identifying the payload encoding in Redis
+_PICKLE_PREFIX = b'P'
+_JSON_PREFIX = b'J'
+
 
 class CacheManager:
     """Async cache manager with Redis and in-memory fallback"""
 
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
-        self.memory_cache: dict = {}  # Fallback in-memory cache
-        self.memory_cache_ttl: dict = {}
+        # Fallback in-memory cache: one TTLCache per TTL bucket (quote/market data/news/...)
+        self.memory_caches: Dict[int, TTLCache] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}  # key -> pending loader result
         self.enabled = settings.REDIS_ENABLED and REDIS_AVAILABLE
 
     async def connect(self):
@@ -40,7 +53,7 @@ class CacheManager:
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD,
-                decode_responses=True,
+                decode_responses=False,  # Payloads are prefixed bytes, see _encode()
                 socket_timeout=2,
                 socket_connect_timeout=2
             )
@@ -57,6 +70,24 @@ class CacheManager:
         if self.redis_client:
             await self.redis_client.close()
 
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a value for Redis (pickle protocol 5 for frames/arrays, JSON otherwise)"""
+        if isinstance(value, _BINARY_TYPES):
+            return _PICKLE_PREFIX + pickle.dumps(value, protocol=5)
+        return _JSON_PREFIX + json.dumps(value).encode()
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        """Deserialize a value written by _encode()"""
+        prefix = raw[:1]
+        if prefix == _PICKLE_PREFIX:
+            return pickle.loads(raw[1:])
+        if prefix == _JSON_PREFIX:
+            return json.loads(raw[1:])
+        # Entries written before the prefix byte was introduced
+        return json.loads(raw)
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         # Try Redis first
@@ -64,37 +95,79 @@ class CacheManager:
             try:
                 value = await self.redis_client.get(key)
                 if value:
-                    return json.loads(value)
+                    return self._decode(value)
             except Exception as e:
                 logger.error(f"Redis GET error: {e}")
 
-        # Fallback to memory cache
-        if key in self.memory_cache:
-            ttl = self.memory_cache_ttl.get(key, 0)
-            if datetime.now().timestamp() < ttl:
-                return self.memory_cache[key]
-            else:
-                # Expired
-                del self.memory_cache[key]
-                del self.memory_cache_ttl[key]
+        # Fallback to memory cache (expired entries are evicted by TTLCache)
+        for bucket in self.memory_caches.values():
+            value = bucket.get(key)
+            if value is not None:
+                return value
 
         return None
 
     async def set(self, key: str, value: Any, ttl: int):
         """Set value in cache with TTL"""
-        serialized = json.dumps(value)
-
         # Try Redis first
         if self.redis_client:
             try:
+                serialized = self._encode(value)
                 await self.redis_client.setex(key, ttl, serialized)
                 return
             except Exception as e:
                 logger.error(f"Redis SET error: {e}")
 
         # Fallback to memory cache
-        self.memory_cache[key] = value
-        self.memory_cache_ttl[key] = datetime.now().timestamp() + ttl
+        bucket = self.memory_caches.get(ttl)
+        if bucket is None:
+            bucket = TTLCache(maxsize=settings.CACHE_MAX_ENTRIES, ttl=ttl)
+            self.memory_caches[ttl] = bucket
+        for other_ttl, other in self.memory_caches.items():
+            if other_ttl != ttl:
+                other.pop(key, None)
+        bucket[key] = value
+
+    async def get_or_set(self, key: str, ttl: int, loader: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        """
+        Get value from cache, or load and cache it on a miss.
+        Concurrent misses for the same key share a single loader call
+        (None results are returned but not cached).
+        """
+        while True:
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only propagate our own cancellation; if the loading caller was
+                # cancelled instead, retry and take over as the loader
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so an unawaited failure isn't logged
+            raise
+        finally:
+            self._inflight.pop(key, None)
 
 
 # Global cache instance
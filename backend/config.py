@@ -2,8 +2,9 @@
 Configuration management for AI Trading Bot v2
 """
 import os
-from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,6 +13,9 @@ class Settings(BaseSettings):
     # API Configuration
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    # Browser origins allowed to call the API cross-origin (the React dev server;
+    # production serves the frontend from the same origin via nginx)
+    CORS_ALLOW_ORIGINS: List[str] = ["http://localhost:3000"]
 
     # NOTE: Robinhood credentials are now entered via web login screen
     # These environment variables are no longer used
@@ -31,10 +35,14 @@ class Settings(BaseSettings):
     # Database Configuration
     DATABASE_PATH: str = "data/trading.db"
 
+    # Disk cache for data source results (survives restarts)
+    DATA_SOURCE_CACHE_DIR: str = "data/source_cache"
+
     # Cache TTLs (in seconds)
     CACHE_TTL_MARKET_DATA: int = 300  # 5 minutes
     CACHE_TTL_NEWS: int = 600  # 10 minutes
     CACHE_TTL_QUOTE: int = 60  # 1 minute for real-time quotes
+    CACHE_MAX_ENTRIES: int = 10000  # Per-TTL bucket limit for the in-memory fallback cache
 
     # Trading Configuration
     # NOTE: DEFAULT_TAKE_PROFIT, DEFAULT_STOP_LOSS, and MAX_POSITION_SIZE
@@ -60,9 +68,13 @@ class Settings(BaseSettings):
     ALPHA_VANTAGE_API_KEY: Optional[str] = None
     FINNHUB_API_KEY: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed from .env only once)"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -4,19 +4,44 @@ Automatically switches between yfinance, AlphaVantage, and Finnhub when rate lim
 """
 import asyncio
 import logging
+import os
+import pickle
+import random
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, ClassVar, Set, Tuple
+from zoneinfo import ZoneInfo
+import aiohttp
+import ijson
+import numpy as np
+import orjson
 import pandas as pd
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import yfinance as yf
+from cachetools import TLRUCache, TTLCache
+
+from . import nyse_calendar
 
 logger = logging.getLogger(__name__)
 
+# Error text that indicates a source is throttling us (matched case-insensitively)
+_RATE_LIMIT_RE = re.compile(
+    r'rate limit|too many requests|429|quota|throttle|temporarily unavailable',
+    re.IGNORECASE
+)
+_ALPHA_VANTAGE_NOTE_RE = re.compile(r'api call frequency|premium', re.IGNORECASE)
+_ALPHA_VANTAGE_INFO_RE = re.compile(r'rate', re.IGNORECASE)
+
+_EASTERN = ZoneInfo('America/New_York')
+
 
 class DataSourceType(Enum):
     """Enum for different data source types"""
@@ -30,7 +55,7 @@ class RateLimitError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     """Tracks circuit breaker state for a data source"""
     failure_count: int = 0
@@ -38,20 +63,25 @@ class CircuitBreakerState:
     is_open: bool = False
     success_count: int = 0
 
-    # Circuit breaker thresholds
-    FAILURE_THRESHOLD: int = 3  # Open circuit after 3 failures
-    SUCCESS_THRESHOLD: int = 2  # Close circuit after 2 successes
-    TIMEOUT_SECONDS: int = 300  # 5 minutes cooldown
+    # Circuit breaker thresholds (class constants, not per-instance state)
+    FAILURE_THRESHOLD: ClassVar[int] = 3  # Open circuit after 3 failures
+    SUCCESS_THRESHOLD: ClassVar[int] = 2  # Close circuit after 2 successes
+    TIMEOUT_SECONDS: ClassVar[int] = 300  # 5 minutes cooldown
+
+    # Monotonic deadline after which an open circuit may be retried
+    # (last_failure_time stays wall-clock for status reporting)
+    retry_at: float = field(default=0.0, repr=False)
 
     def record_failure(self):
         """Record a failure and potentially open the circuit"""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self.retry_at = time.monotonic() + self.TIMEOUT_SECONDS
         self.success_count = 0
 
         if self.failure_count >= self.FAILURE_THRESHOLD:
             self.is_open = True
-            logger.warning(f"Circuit breaker OPENED after {self.failure_count} failures")
+            logger.warning("Circuit breaker OPENED after %s failures", self.failure_count)
 
     def record_success(self):
         """Record a success and potentially close the circuit"""
@@ -64,43 +94,144 @@ class CircuitBreakerState:
 
     def can_attempt(self) -> bool:
         """Check if we can attempt a call (circuit not open or timeout expired)"""
+        # Closed circuit (the common case) needs no clock read
         if not self.is_open:
             return True
 
         # Check if timeout has expired (half-open state)
-        if self.last_failure_time:
-            time_since_failure = time.time() - self.last_failure_time
-            if time_since_failure >= self.TIMEOUT_SECONDS:
-                logger.info("Circuit breaker entering HALF-OPEN state (timeout expired)")
-                self.is_open = False
-                self.failure_count = 0
-                return True
+        if time.monotonic() >= self.retry_at:
+            logger.info("Circuit breaker entering HALF-OPEN state (timeout expired)")
+            self.is_open = False
+            self.failure_count = 0
+            return True
 
         return False
 
 
+class TokenBucket:
+    """Async token-bucket rate limiter: at most `rate` acquisitions per `period` seconds"""
+
+    def __init__(self, rate: int, period: float):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+
 class DataSource(ABC):
     """Abstract base class for data sources"""
 
+    # HTTP retry policy (exponential backoff with full jitter)
+    MAX_RETRIES: int = 3
+    BACKOFF_FACTOR: float = 1.0
+    BACKOFF_MAX_SECONDS: float = 120.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    REQUEST_TIMEOUT_SECONDS: int = 10
+
+    # Connection pool sizing (keep-alive connections are reused across tickers)
+    POOL_MAX_CONNECTIONS: int = 50
+    POOL_MAX_PER_HOST: int = 20
+    KEEPALIVE_TIMEOUT_SECONDS: int = 75
+    DNS_CACHE_TTL_SECONDS: int = 300
+
+    # Price history columns returned by every source (named like yfinance)
+    OHLCV_COLUMNS: Tuple[str, ...] = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+    # One HTTP session per source class, shared by every instance (and orchestrator)
+    # so keep-alive connections survive orchestrator lifecycles
+    _shared_http: ClassVar[Dict[type, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]]] = {}
+
     def __init__(self, name: str):
         self.name = name
         self.circuit_breaker = CircuitBreakerState()
-        self._session = self._create_session()
-
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic"""
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        self.rate_limiter: Optional[TokenBucket] = None  # Set by sources with a published request quota
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get (or lazily create) the async HTTP session shared by this source class"""
+        loop = asyncio.get_running_loop()
+        owner, session = self._shared_http.get(type(self), (None, None))
+        if session is None or session.closed or owner is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.POOL_MAX_CONNECTIONS,
+                limit_per_host=self.POOL_MAX_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT_SECONDS,
+                ttl_dns_cache=self.DNS_CACHE_TTL_SECONDS
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_SECONDS)
+            )
+            self._shared_http[type(self)] = (loop, session)
         return session
 
+    def _backoff_time(self, retry: int) -> float:
+        """
+        Seconds to sleep before the given retry (1-based).
+        Full jitter: uniform over [0, urllib3-style exponential backoff], so
+        concurrent callers hitting the same 429 don't retry in lockstep.
+        """
+        if retry <= 1:
+            return 0.0
+        return random.uniform(0, min(self.BACKOFF_MAX_SECONDS, self.BACKOFF_FACTOR * (2 ** (retry - 1))))
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """GET and decode a JSON document (see _get for retry behavior)"""
+        return await self._get(url, params, self._read_json)
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        return orjson.loads(await response.read())
+
+    async def _get(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        parse: Callable[[aiohttp.ClientResponse], Awaitable[Any]]
+    ) -> Any:
+        """
+        GET a resource without blocking the event loop and parse the response body.
+        Retries connection errors, timeouts and RETRY_STATUSES with exponential
+        backoff; raises RateLimitError if the source still answers 429.
+        """
+        session = self._get_http_session()
+
+        for retry in range(self.MAX_RETRIES + 1):
+            if retry:
+                await asyncio.sleep(self._backoff_time(retry))
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status in self.RETRY_STATUSES and retry < self.MAX_RETRIES:
+                        continue
+                    if response.status == 429:
+                        raise RateLimitError(f"{self.name} rate limit exceeded (HTTP 429)")
+                    response.raise_for_status()
+                    return await parse(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if retry >= self.MAX_RETRIES:
+                    raise
+
+    async def aclose(self):
+        """Close the shared HTTP session for this source class (if one was opened)"""
+        _, session = self._shared_http.pop(type(self), (None, None))
+        if session is not None and not session.closed:
+            await session.close()
+
     def is_available(self) -> bool:
         """Check if this data source is available"""
         return self.circuit_breaker.can_attempt()
@@ -111,12 +242,20 @@ class DataSource(ABC):
 
     def _handle_failure(self, error: Exception):
         """Record failed API call"""
-        logger.error(f"{self.name} failure: {error}")
+        logger.error("%s failure: %s", self.name, error)
         self.circuit_breaker.record_failure()
 
     @abstractmethod
-    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
-        """Fetch historical OHLCV data"""
+    async def get_historical_data(
+        self,
+        ticker: str,
+        started: Optional[Callable[[], None]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch historical OHLCV data.
+        `started` (if given) is called once the request is actually under way, after
+        any local queueing; it may be called from a worker thread.
+        """
         pass
 
     @abstractmethod
@@ -133,27 +272,76 @@ class DataSource(ABC):
 class YFinanceDataSource(DataSource):
     """YFinance data source (primary)"""
 
+    # yf.Ticker objects (and their last prices) are reused for this long
+    TICKER_CACHE_TTL_SECONDS: int = 60
+    TICKER_CACHE_MAX_ENTRIES: int = 512
+
+    # yf.download collects results in module-level globals, so concurrent calls
+    # from worker threads are serialized (Ticker.history/.news are per-object)
+    _download_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
         super().__init__("YFinance")
-        import yfinance as yf
-        self.yf = yf
+        self._tickers = TTLCache(maxsize=self.TICKER_CACHE_MAX_ENTRIES, ttl=self.TICKER_CACHE_TTL_SECONDS)
+        self._prices = TTLCache(maxsize=self.TICKER_CACHE_MAX_ENTRIES, ttl=self.TICKER_CACHE_TTL_SECONDS)
+
+    def _get_ticker(self, ticker: str):
+        """Get a (recently created) yf.Ticker shared by quote and news lookups"""
+        stock = self._tickers.get(ticker)
+        if stock is None:
+            stock = yf.Ticker(ticker)
+            self._tickers[ticker] = stock
+        return stock
+
+    def _download(self, tickers, on_start: Optional[Callable[[], None]] = None, **kwargs) -> pd.DataFrame:
+        """yf.download (blocking - run it via asyncio.to_thread); on_start runs once the lock is held"""
+        with self._download_lock:
+            if on_start:
+                on_start()
+            return yf.download(tickers, progress=False, **kwargs)
+
+    @staticmethod
+    def _fetch_last_price(stock) -> Optional[float]:
+        """
+        Latest price from the 1-day chart (blocking). The chart metadata carries
+        regularMarketPrice, so this avoids downloading the much larger Ticker.info blob.
+        """
+        bars = stock.history(period="1d")
+        price = stock.get_history_metadata().get('regularMarketPrice')
+        if not price and not bars.empty:
+            price = bars['Close'].iloc[-1]
+        return price
+
+    def _fetch_last_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Latest prices for many tickers from a single yf.download call (blocking)"""
+        df = self._download(tickers, period="1d", auto_adjust=False)
+        if df is None or df.empty:
+            return {}
+
+        closes = df['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+        last = closes.ffill().iloc[-1].dropna()
+        return {ticker: float(price) for ticker, price in last.items()}
 
     def _is_rate_limit_error(self, error: Exception) -> bool:
         """Check if error is due to rate limiting"""
-        error_msg = str(error).lower()
-        rate_limit_indicators = [
-            'rate limit', 'too many requests', '429', 'quota',
-            'throttle', 'temporarily unavailable'
-        ]
-        return any(indicator in error_msg for indicator in rate_limit_indicators)
+        return _RATE_LIMIT_RE.search(str(error)) is not None
 
-    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
+    async def get_historical_data(
+        self,
+        ticker: str,
+        started: Optional[Callable[[], None]] = None
+    ) -> Optional[pd.DataFrame]:
         """Fetch historical data from yfinance"""
         if not self.is_available():
             raise RateLimitError(f"{self.name} circuit breaker is OPEN")
 
         try:
-            df = self.yf.download(ticker, period="1y", progress=False)
+            # Blocking network call + parse - run it off the event loop. Downloads queue
+            # on _download_lock, so `started` fires only once this one gets its turn.
+            on_start = partial(asyncio.get_running_loop().call_soon_threadsafe, started) if started else None
+            df = await asyncio.to_thread(self._download, ticker, on_start=on_start, period="1y")
 
             if df is None or df.empty:
                 raise ValueError(f"No data returned for {ticker}")
@@ -162,9 +350,8 @@ class YFinanceDataSource(DataSource):
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = df.columns.get_level_values(0)
 
-            # Rename Adj Close
-            if 'Adj Close' in df.columns:
-                df = df.rename(columns={'Adj Close': 'Adj_Close'})
+            # Keep only OHLCV - nothing downstream reads Adj Close
+            df = df[[column for column in self.OHLCV_COLUMNS if column in df.columns]]
 
             self._handle_success()
             return df
@@ -182,9 +369,11 @@ class YFinanceDataSource(DataSource):
             raise RateLimitError(f"{self.name} circuit breaker is OPEN")
 
         try:
-            stock = self.yf.Ticker(ticker)
-            info = stock.info
-            price = info.get('currentPrice') or info.get('regularMarketPrice')
+            price = self._prices.get(ticker)
+            if price is None:
+                price = await asyncio.to_thread(self._fetch_last_price, self._get_ticker(ticker))
+                if price:
+                    self._prices[ticker] = price
 
             if not price:
                 raise ValueError(f"No price data for {ticker}")
@@ -199,14 +388,45 @@ class YFinanceDataSource(DataSource):
             self._handle_failure(e)
             raise
 
+    async def get_quotes(self, tickers: List[str]) -> Dict[str, float]:
+        """Fetch real-time quotes for many tickers with one batched download"""
+        if not self.is_available():
+            raise RateLimitError(f"{self.name} circuit breaker is OPEN")
+
+        try:
+            prices = {}
+            missing = []
+            for ticker in tickers:
+                price = self._prices.get(ticker)
+                if price is None:
+                    missing.append(ticker)
+                else:
+                    prices[ticker] = price
+
+            if missing:
+                fetched = await asyncio.to_thread(self._fetch_last_prices, missing)
+                for ticker, price in fetched.items():
+                    self._prices[ticker] = price
+                prices.update(fetched)
+
+            self._handle_success()
+            return prices
+
+        except Exception as e:
+            if self._is_rate_limit_error(e):
+                self._handle_failure(RateLimitError(f"Rate limit hit: {e}"))
+                raise RateLimitError(f"YFinance rate limit: {e}")
+            self._handle_failure(e)
+            raise
+
     async def get_news(self, ticker: str) -> List[Dict]:
         """Fetch news from yfinance"""
         if not self.is_available():
             raise RateLimitError(f"{self.name} circuit breaker is OPEN")
 
         try:
-            stock = self.yf.Ticker(ticker)
-            raw_news = stock.news
+            stock = self._get_ticker(ticker)
+            raw_news = await asyncio.to_thread(lambda: stock.news)  # Blocking HTTP call
 
             if not raw_news:
                 return []
@@ -237,24 +457,71 @@ class AlphaVantageDataSource(DataSource):
     """AlphaVantage data source (fallback for historical data & quotes)"""
 
     BASE_URL = "https://www.alphavantage.co/query"
+    OHLCV_FIELDS = ('1. open', '2. high', '3. low', '4. close', '5. volume')
+    DAILY_SERIES_PREFIX = 'Time Series (Daily).'
+
+    # Free-tier quota: 5 requests per minute
+    RATE_LIMIT_REQUESTS: int = 5
+    RATE_LIMIT_PERIOD_SECONDS: int = 60
+
+    # The quota caps useful parallelism, so bursts queue on warm keep-alive
+    # connections instead of paying extra TLS handshakes
+    POOL_MAX_PER_HOST: int = RATE_LIMIT_REQUESTS
 
     def __init__(self, api_key: str):
         super().__init__("AlphaVantage")
         self.api_key = api_key
+        self.rate_limiter = TokenBucket(self.RATE_LIMIT_REQUESTS, self.RATE_LIMIT_PERIOD_SECONDS)
 
     def _is_rate_limit_error(self, response_data: Dict) -> bool:
         """Check if API response indicates rate limiting"""
         if isinstance(response_data, dict):
-            note = response_data.get('Note', '').lower()
-            info = response_data.get('Information', '').lower()
-            return 'api call frequency' in note or 'premium' in note or 'rate' in info
+            return (
+                _ALPHA_VANTAGE_NOTE_RE.search(response_data.get('Note', '')) is not None
+                or _ALPHA_VANTAGE_INFO_RE.search(response_data.get('Information', '')) is not None
+            )
         return False
 
-    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
+    async def _stream_daily_series(
+        self,
+        response: aiohttp.ClientResponse,
+        cutoff: str
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
+        """
+        Incrementally parse a TIME_SERIES_DAILY response, keeping only bars dated
+        after `cutoff` (ISO date) so the full history is never materialized.
+
+        Returns:
+            (top-level string fields such as Note/Information, {date: {field: value}})
+        """
+        top_level: Dict[str, str] = {}
+        bars: Dict[str, Dict[str, str]] = {}
+        series_prefix = self.DAILY_SERIES_PREFIX
+
+        async for prefix, event, value in ijson.parse_async(response.content):
+            if event not in ('string', 'number'):
+                continue
+            if prefix.startswith(series_prefix):
+                day, _, field = prefix[len(series_prefix):].partition('.')
+                if day > cutoff:
+                    bars.setdefault(day, {})[field] = value
+            elif '.' not in prefix:
+                top_level[prefix] = value
+
+        return top_level, bars
+
+    async def get_historical_data(
+        self,
+        ticker: str,
+        started: Optional[Callable[[], None]] = None
+    ) -> Optional[pd.DataFrame]:
         """Fetch daily historical data from AlphaVantage"""
         if not self.is_available():
             raise RateLimitError(f"{self.name} circuit breaker is OPEN")
 
+        if started:
+            started()
+
         try:
             params = {
                 'function': 'TIME_SERIES_DAILY',
@@ -263,40 +530,33 @@ class AlphaVantageDataSource(DataSource):
                 'apikey': self.api_key
             }
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._session.get(self.BASE_URL, params=params, timeout=10)
+            # Only the last year is kept (to match yfinance behavior) - the full
+            # history is 20+ years, so bars are filtered while streaming
+            cutoff = (datetime.now() - timedelta(days=365)).date().isoformat()
+            top_level, time_series = await self._get(
+                self.BASE_URL,
+                params,
+                lambda response: self._stream_daily_series(response, cutoff)
             )
-            response.raise_for_status()
-            data = response.json()
 
             # Check for rate limiting
-            if self._is_rate_limit_error(data):
+            if self._is_rate_limit_error(top_level):
                 raise RateLimitError("AlphaVantage rate limit exceeded")
 
-            # Parse time series data
-            time_series = data.get('Time Series (Daily)', {})
             if not time_series:
                 raise ValueError(f"No data available for {ticker}")
 
-            # Convert to DataFrame
-            df = pd.DataFrame.from_dict(time_series, orient='index')
-            df.index = pd.to_datetime(df.index)
-            df = df.sort_index()
-
-            # Rename columns to match yfinance format
-            df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            df = df.astype(float)
-
-            # Get only last 1 year to match yfinance behavior
-            one_year_ago = datetime.now() - timedelta(days=365)
-            df = df[df.index >= one_year_ago]
-
-            # Add Adj_Close (same as Close for AlphaVantage)
-            df['Adj_Close'] = df['Close']
+            # Build the OHLCV matrix in one pass, named to match yfinance format
+            dates = sorted(time_series)
+            values = np.array(
+                [[time_series[day][field] for field in self.OHLCV_FIELDS] for day in dates],
+                dtype=float
+            ).reshape(len(dates), len(self.OHLCV_FIELDS))
+            index = pd.DatetimeIndex(np.array(dates, dtype='datetime64[D]'))
+            df = pd.DataFrame(values, index=index, columns=list(self.OHLCV_COLUMNS))
 
             self._handle_success()
-            logger.info(f"AlphaVantage: Successfully fetched {len(df)} days for {ticker}")
+            logger.info("AlphaVantage: Successfully fetched %s days for %s", len(df), ticker)
             return df
 
         except RateLimitError:
@@ -318,12 +578,7 @@ class AlphaVantageDataSource(DataSource):
                 'apikey': self.api_key
             }
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._session.get(self.BASE_URL, params=params, timeout=10)
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(self.BASE_URL, params)
 
             # Check for rate limiting
             if self._is_rate_limit_error(data):
@@ -337,7 +592,7 @@ class AlphaVantageDataSource(DataSource):
 
             price = float(price_str)
             self._handle_success()
-            logger.info(f"AlphaVantage: Quote for {ticker} = ${price}")
+            logger.info("AlphaVantage: Quote for %s = $%s", ticker, price)
             return price
 
         except RateLimitError:
@@ -352,6 +607,13 @@ class AlphaVantageDataSource(DataSource):
         return []
 
 
+@lru_cache(maxsize=1)
+def _news_date_window(day_ordinal: int) -> Tuple[str, str]:
+    """(from, to) ISO date strings for the 7-day news window ending on the given day"""
+    today = date.fromordinal(day_ordinal)
+    return (today - timedelta(days=7)).isoformat(), today.isoformat()
+
+
 class FinnhubDataSource(DataSource):
     """Finnhub data source (fallback for news only)"""
 
@@ -360,12 +622,13 @@ class FinnhubDataSource(DataSource):
     def __init__(self, api_key: str):
         super().__init__("Finnhub")
         self.api_key = api_key
+        self._news_url = f"{self.BASE_URL}/company-news"
 
-    def _is_rate_limit_error(self, status_code: int) -> bool:
-        """Check if status code indicates rate limiting"""
-        return status_code == 429
-
-    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
+    async def get_historical_data(
+        self,
+        ticker: str,
+        started: Optional[Callable[[], None]] = None
+    ) -> Optional[pd.DataFrame]:
         """Finnhub is not used for historical data"""
         raise NotImplementedError("Finnhub does not support historical data")
 
@@ -379,9 +642,8 @@ class FinnhubDataSource(DataSource):
             raise RateLimitError(f"{self.name} circuit breaker is OPEN")
 
         try:
-            # Get news from last 7 days
-            to_date = datetime.now().strftime('%Y-%m-%d')
-            from_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            # Get news from last 7 days (date strings are computed once per day)
+            from_date, to_date = _news_date_window(date.today().toordinal())
 
             params = {
                 'symbol': ticker,
@@ -390,20 +652,8 @@ class FinnhubDataSource(DataSource):
                 'token': self.api_key
             }
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._session.get(
-                    f"{self.BASE_URL}/company-news",
-                    params=params,
-                    timeout=10
-                )
-            )
-
-            if self._is_rate_limit_error(response.status_code):
-                raise RateLimitError("Finnhub rate limit exceeded")
-
-            response.raise_for_status()
-            data = response.json()
+            # HTTP 429 surfaces as RateLimitError from _get_json()
+            data = await self._get_json(self._news_url, params)
 
             if not data or not isinstance(data, list):
                 return []
@@ -419,7 +669,7 @@ class FinnhubDataSource(DataSource):
                 })
 
             self._handle_success()
-            logger.info(f"Finnhub: Fetched {len(news_list)} articles for {ticker}")
+            logger.info("Finnhub: Fetched %s articles for %s", len(news_list), ticker)
             return news_list
 
         except RateLimitError:
@@ -430,19 +680,124 @@ class FinnhubDataSource(DataSource):
             raise
 
 
+class SourceCache:
+    """
+    Two-tier (memory + disk) cache for orchestrator results.
+    Entries are keyed by (method, ticker, day) and expire after the method's TTL;
+    disk entries live in {cache_dir}/{ticker}/{method}.pkl and survive restarts.
+    """
+
+    def __init__(self, ttls: Dict[str, int], cache_dir: Optional[str] = None, maxsize: int = 10_000):
+        self.ttls = ttls
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Values are stored as (expires_at, value) so entries loaded from disk keep their original expiry
+        self.memory: Dict[str, TLRUCache] = {
+            method: TLRUCache(maxsize=maxsize, ttu=lambda _key, entry, _now: entry[0], timer=time.time)
+            for method in ttls
+        }
+
+    def _path(self, method: str, ticker: str) -> Path:
+        return self.cache_dir / ticker / f"{method}.pkl"
+
+    async def get(self, method: str, ticker: str) -> Optional[Any]:
+        """Get a cached result for today, checking memory first and then disk"""
+        key = (ticker, date.today().isoformat())
+        entry = self.memory[method].get(key)
+        if entry is not None:
+            return entry[1]
+
+        if self.cache_dir is None:
+            return None
+
+        # File I/O and unpickling run in a worker thread, off the event loop
+        entry = await asyncio.to_thread(self._read_file, method, ticker, key[1])
+        if entry is None:
+            return None
+
+        self.memory[method][key] = entry
+        return entry[1]
+
+    def _read_file(self, method: str, ticker: str, day: str) -> Optional[Tuple[float, Any]]:
+        """(expires_at, value) from the disk cache if it is still valid for `day` (blocking)"""
+        try:
+            with open(self._path(method, ticker), 'rb') as f:
+                expires_at, cached_day, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache file for %s:%s: %s", method, ticker, e)
+            return None
+
+        if cached_day != day or time.time() >= expires_at:
+            return None
+        return expires_at, value
+
+    async def set(self, method: str, ticker: str, value: Any, ttl: Optional[float] = None):
+        """Cache a result in memory and (if configured) on disk (ttl overrides the method's TTL)"""
+        day = date.today().isoformat()
+        expires_at = time.time() + (self.ttls[method] if ttl is None else ttl)
+        self.memory[method][(ticker, day)] = (expires_at, value)
+
+        if self.cache_dir is not None:
+            await asyncio.to_thread(self._write_file, method, ticker, (expires_at, day, value))
+
+    def _write_file(self, method: str, ticker: str, entry: Tuple[float, str, Any]):
+        """Atomically write a cache entry to disk, so readers never see a partial file (blocking)"""
+        try:
+            path = self._path(method, ticker)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Failed to write cache file for %s:%s: %s", method, ticker, e)
+
+
 class DataSourceOrchestrator:
     """
     Intelligent orchestrator that manages multiple data sources with automatic fallback.
     Uses circuit breaker pattern to handle rate limits gracefully.
     """
 
+    # Hedged fallback: start the next source if the current one is this slow
+    HEDGE_DELAY_SECONDS: float = 0.5
+    # Price history downloads are larger and queue behind each other locally, so they
+    # are hedged only once the download itself has been running this long
+    HISTORY_HEDGE_DELAY_SECONDS: float = 5.0
+    MAX_CONCURRENT_ATTEMPTS: int = 2
+
+    # Sources that just hit a rate limit are skipped (without probing) for this long
+    RATE_LIMIT_SKIP_SECONDS: int = 30
+
+    # Result cache TTLs (seconds) per orchestrator method
+    CACHE_TTLS = {
+        'historical_data': 3600,
+        'quote': 60,
+        'news': 900,
+    }
+
     def __init__(
         self,
         alpha_vantage_key: Optional[str] = None,
-        finnhub_key: Optional[str] = None
+        finnhub_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        live_history_ttl: Optional[int] = None
     ):
-        """Initialize orchestrator with all available data sources"""
+        """
+        Initialize orchestrator with all available data sources.
+        live_history_ttl caps the price history TTL while the market is open
+        (today's bar is still forming); None keeps the regular TTL.
+        """
         self.sources: Dict[str, DataSource] = {}
+        self._cache = SourceCache(self.CACHE_TTLS, cache_dir)
+        self.live_history_ttl = live_history_ttl
+
+        # Negative-result cache: rate-limited sources are skipped for the rest of
+        # the current batch, or for RATE_LIMIT_SKIP_SECONDS outside a batch
+        self._rate_limited = TTLCache(maxsize=16, ttl=self.RATE_LIMIT_SKIP_SECONDS)
+        # Per task context, so overlapping batches (and code outside any batch) never share a set
+        self._batch_skip: ContextVar[Optional[Set[str]]] = ContextVar(f"batch_skip_{id(self)}", default=None)
 
         # Primary source: YFinance (always available)
         self.sources['yfinance'] = YFinanceDataSource()
@@ -461,108 +816,315 @@ class DataSourceOrchestrator:
         self.quote_priority = ['yfinance', 'alphavantage']
         self.news_priority = ['finnhub', 'yfinance']  # Finnhub primary for news
 
-    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
+        # Resolve priority lists to (name, source) chains once - sources are fixed after init
+        self._historical_chain = self._resolve_chain(self.historical_data_priority)
+        self._quote_chain = self._resolve_chain(self.quote_priority)
+        self._news_chain = self._resolve_chain(self.news_priority)
+
+    def _history_ttl(self) -> float:
         """
-        Fetch historical data with intelligent fallback.
-        Tries sources in priority order until one succeeds.
+        Seconds to cache price history: capped at live_history_ttl during the
+        session, and never past the next open before it
         """
-        last_error = None
+        ttl = self.CACHE_TTLS['historical_data']
+        if self.live_history_ttl is None:
+            return ttl
+
+        now = datetime.now(_EASTERN)
+        hours = nyse_calendar.session(now.date())
+        if hours:
+            open_at = datetime.combine(now.date(), hours[0], tzinfo=_EASTERN)
+            close_at = datetime.combine(now.date(), hours[1], tzinfo=_EASTERN)
+            if open_at <= now < close_at:
+                return min(ttl, self.live_history_ttl)
+            if now < open_at:
+                return min(ttl, (open_at - now).total_seconds())
+        return ttl
+
+    def _resolve_chain(self, priority: List[str]) -> Tuple[Tuple[str, DataSource], ...]:
+        """Map a priority list to the configured sources, skipping missing ones"""
+        return tuple((name, self.sources[name]) for name in priority if name in self.sources)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Group fetches for many tickers: once a source is rate limited inside the
+        batch, it isn't consulted again until the batch ends.
+        """
+        skip = self._batch_skip.get()
+        token = self._batch_skip.set(set() if skip is None else skip)
+        try:
+            yield
+        finally:
+            self._batch_skip.reset(token)
+
+    def _is_skipped(self, source_name: str) -> bool:
+        """Whether a source recently hit a rate limit and should not be tried"""
+        skip = self._batch_skip.get()
+        if skip is not None and source_name in skip:
+            return True
+        return source_name in self._rate_limited
 
-        for source_name in self.historical_data_priority:
-            source = self.sources.get(source_name)
-            if not source:
-                continue
+    def _mark_rate_limited(self, source_name: str):
+        """Remember that a source is rate limited"""
+        skip = self._batch_skip.get()
+        if skip is not None:
+            skip.add(source_name)
+        self._rate_limited[source_name] = True
 
-            if not source.is_available():
-                logger.warning(f"{source_name} unavailable (circuit breaker OPEN), trying next source")
-                continue
+    async def _fetch_with_fallback(
+        self,
+        kind: str,
+        ticker: str,
+        chain: Tuple[Tuple[str, DataSource], ...],
+        fetch: Callable[[DataSource, Callable[[], None]], Awaitable[Any]],
+        is_valid: Callable[[Any], bool],
+        hedge_delay: Optional[float] = None,
+        reports_start: bool = False
+    ) -> Tuple[Optional[str], Any, Optional[Exception]]:
+        """
+        Try the sources in a resolved priority chain with hedging.
+
+        A failed (or empty) attempt immediately starts the next source. If an
+        attempt has been running for `hedge_delay` seconds (HEDGE_DELAY_SECONDS by
+        default), the next source is started alongside it (at most
+        MAX_CONCURRENT_ATTEMPTS in flight). The first valid result wins and the
+        remaining attempts are cancelled. Sources with a published request quota
+        (a rate_limiter) are never started as a hedge, only once the attempts
+        before them have failed.
+
+        `fetch(source, started)` starts an attempt. With `reports_start`, the hedge
+        clock only runs once the attempt calls `started()`, so time spent queueing
+        locally doesn't trigger a hedge; otherwise it runs from the moment the
+        attempt is created.
+
+        Returns:
+            (winning source name, result, None) or (None, None, last error)
+        """
+        if hedge_delay is None:
+            hedge_delay = self.HEDGE_DELAY_SECONDS
+
+        loop = asyncio.get_running_loop()
+        candidates = list(chain)
+        hedge_blocked = False  # The next candidate may only run as a fallback
+        pending: Dict[asyncio.Task, str] = {}
+        started_at: Dict[str, float] = {}
+        progress: asyncio.Future = loop.create_future()  # Resolved when an attempt reports its start
+        winner: Optional[str] = None
+        result: Any = None
+        last_error: Optional[Exception] = None
+
+        def mark_started(source_name: str):
+            started_at.setdefault(source_name, loop.time())
+            if not progress.done():
+                progress.set_result(None)
+
+        def start_next(hedge: bool = False) -> bool:
+            nonlocal hedge_blocked
+            while candidates:
+                source_name, source = candidates[0]
+                if self._is_skipped(source_name):
+                    candidates.pop(0)
+                    continue
+
+                if not source.is_available():
+                    logger.warning("%s unavailable (circuit breaker OPEN), trying next source", source_name)
+                    candidates.pop(0)
+                    continue
+
+                if hedge and source.rate_limiter is not None:
+                    # Don't spend a tight request quota on a hedge - wait for the current attempt
+                    hedge_blocked = True
+                    return True
+
+                candidates.pop(0)
+                logger.info("Attempting %s fetch for %s from %s", kind, ticker, source_name)
+                started = partial(mark_started, source_name)
+                if not reports_start:
+                    started()
+                pending[asyncio.create_task(fetch(source, started))] = source_name
+                return True
+            return False
 
-            try:
-                logger.info(f"Attempting historical data fetch for {ticker} from {source_name}")
-                data = await source.get_historical_data(ticker)
-                if data is not None and not data.empty:
-                    logger.info(f"✓ Successfully fetched historical data from {source_name}")
-                    return data
-            except RateLimitError as e:
-                logger.warning(f"{source_name} rate limit hit: {e}")
-                last_error = e
-                continue
-            except Exception as e:
-                logger.error(f"{source_name} error: {e}")
-                last_error = e
-                continue
+        exhausted = not start_next()
+        try:
+            while pending and winner is None:
+                waits = set(pending)
+                timeout = None
+                if not exhausted and not hedge_blocked and len(pending) < self.MAX_CONCURRENT_ATTEMPTS:
+                    starts = [started_at.get(source_name) for source_name in pending.values()]
+                    if None in starts:
+                        # Still queued - wait for it to start (or finish) before timing it
+                        if progress.done():
+                            progress = loop.create_future()
+                        waits.add(progress)
+                    else:
+                        timeout = max(0.0, max(starts) + hedge_delay - loop.time())
+
+                done, _ = await asyncio.wait(waits, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                done = [task for task in done if task in pending]
+
+                if not done:
+                    if timeout is not None:
+                        # Current attempt is slow - hedge with the next source
+                        exhausted = not start_next(hedge=True)
+                    continue
+
+                for task in done:
+                    source_name = pending.pop(task)
+                    try:
+                        data = task.result()
+                    except RateLimitError as e:
+                        logger.warning("%s rate limit hit: %s", source_name, e)
+                        self._mark_rate_limited(source_name)
+                        last_error = e
+                        continue
+                    except Exception as e:
+                        logger.error("%s error: %s", source_name, e)
+                        last_error = e
+                        continue
+
+                    if winner is None and is_valid(data):
+                        winner, result = source_name, data
+
+                # Replace finished attempts that didn't produce a result
+                if winner is None and not pending and not exhausted:
+                    exhausted = not start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Consume the losers' outcomes so their errors aren't reported as unretrieved
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner is None:
+            return None, None, last_error
+        return winner, result, None
 
-        logger.error(f"All data sources failed for {ticker}. Last error: {last_error}")
+    async def get_historical_data(self, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch historical data with intelligent fallback.
+        Tries sources in priority order (hedged) until one succeeds.
+        """
+        cached = await self._cache.get('historical_data', ticker)
+        if cached is not None:
+            return cached.copy()  # Callers add indicator columns in place
+
+        source_name, data, last_error = await self._fetch_with_fallback(
+            'historical data',
+            ticker,
+            self._historical_chain,
+            lambda source, started: source.get_historical_data(ticker, started),
+            lambda df: df is not None and not df.empty,
+            hedge_delay=self.HISTORY_HEDGE_DELAY_SECONDS,
+            reports_start=True
+        )
+
+        if source_name:
+            logger.info("✓ Successfully fetched historical data from %s", source_name)
+            await self._cache.set('historical_data', ticker, data.copy(), self._history_ttl())
+            return data
+
+        logger.error("All data sources failed for %s. Last error: %s", ticker, last_error)
         return None
 
     async def get_quote(self, ticker: str) -> Optional[float]:
         """
         Fetch real-time quote with intelligent fallback.
-        Tries sources in priority order until one succeeds.
+        Tries sources in priority order (hedged) until one succeeds.
         """
-        last_error = None
+        cached = await self._cache.get('quote', ticker)
+        if cached is not None:
+            return cached
+
+        source_name, quote, last_error = await self._fetch_with_fallback(
+            'quote',
+            ticker,
+            self._quote_chain,
+            lambda source, _started: source.get_quote(ticker),
+            lambda price: price is not None
+        )
 
-        for source_name in self.quote_priority:
-            source = self.sources.get(source_name)
-            if not source:
-                continue
+        if source_name:
+            logger.info("✓ Successfully fetched quote from %s", source_name)
+            await self._cache.set('quote', ticker, quote)
+            return quote
 
-            if not source.is_available():
-                logger.warning(f"{source_name} unavailable (circuit breaker OPEN), trying next source")
-                continue
+        logger.error("All quote sources failed for %s. Last error: %s", ticker, last_error)
+        return None
 
+    async def get_quotes(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch real-time quotes for many tickers.
+        One batched yfinance download covers most of them; whatever it misses goes
+        through the per-ticker fallback chain concurrently.
+
+        Returns:
+            {ticker: price} for the tickers that could be priced
+        """
+        quotes = {}
+        missing = []
+        cached_quotes = await asyncio.gather(*(self._cache.get('quote', ticker) for ticker in tickers))
+        for ticker, cached in zip(tickers, cached_quotes):
+            if cached is None:
+                missing.append(ticker)
+            else:
+                quotes[ticker] = cached
+
+        yfinance = self.sources.get('yfinance')
+        if missing and yfinance and not self._is_skipped('yfinance') and yfinance.is_available():
+            logger.info("Attempting batch quote fetch for %d tickers from yfinance", len(missing))
             try:
-                logger.info(f"Attempting quote fetch for {ticker} from {source_name}")
-                quote = await source.get_quote(ticker)
-                if quote is not None:
-                    logger.info(f"✓ Successfully fetched quote from {source_name}")
-                    return quote
+                fetched = await yfinance.get_quotes(missing)
             except RateLimitError as e:
-                logger.warning(f"{source_name} rate limit hit: {e}")
-                last_error = e
-                continue
+                logger.warning("yfinance rate limit hit: %s", e)
+                self._mark_rate_limited('yfinance')
+                fetched = {}
             except Exception as e:
-                logger.error(f"{source_name} error: {e}")
-                last_error = e
-                continue
+                logger.error("yfinance batch quote error: %s", e)
+                fetched = {}
 
-        logger.error(f"All quote sources failed for {ticker}. Last error: {last_error}")
-        return None
+            await asyncio.gather(*(self._cache.set('quote', ticker, price) for ticker, price in fetched.items()))
+            quotes.update(fetched)
+            missing = [ticker for ticker in missing if ticker not in fetched]
+
+        if missing:
+            async with self.batch():
+                prices = await asyncio.gather(*(self.get_quote(ticker) for ticker in missing))
+            quotes.update({ticker: price for ticker, price in zip(missing, prices) if price is not None})
+
+        return quotes
 
     async def get_news(self, ticker: str) -> List[Dict]:
         """
         Fetch news with intelligent fallback.
-        Tries sources in priority order until one succeeds.
+        Tries sources in priority order (hedged) until one succeeds.
         """
-        last_error = None
-
-        for source_name in self.news_priority:
-            source = self.sources.get(source_name)
-            if not source:
-                continue
+        cached = await self._cache.get('news', ticker)
+        if cached is not None:
+            return cached
+
+        source_name, news, last_error = await self._fetch_with_fallback(
+            'news',
+            ticker,
+            self._news_chain,
+            lambda source, _started: source.get_news(ticker),
+            bool
+        )
 
-            if not source.is_available():
-                logger.warning(f"{source_name} unavailable (circuit breaker OPEN), trying next source")
-                continue
+        if source_name:
+            logger.info("✓ Successfully fetched %s articles from %s", len(news), source_name)
+            await self._cache.set('news', ticker, news)
+            return news
 
-            try:
-                logger.info(f"Attempting news fetch for {ticker} from {source_name}")
-                news = await source.get_news(ticker)
-                if news:
-                    logger.info(f"✓ Successfully fetched {len(news)} articles from {source_name}")
-                    return news
-            except RateLimitError as e:
-                logger.warning(f"{source_name} rate limit hit: {e}")
-                last_error = e
-                continue
-            except Exception as e:
-                logger.error(f"{source_name} error: {e}")
-                last_error = e
-                continue
-
-        logger.warning(f"All news sources failed for {ticker}. Last error: {last_error}")
+        logger.warning("All news sources failed for %s. Last error: %s", ticker, last_error)
         return []
 
+    async def aclose(self):
+        """Close HTTP sessions held by all data sources"""
+        for source in self.sources.values():
+            await source.aclose()
+
     def get_status(self) -> Dict[str, Any]:
         """Get status of all data sources (for monitoring/debugging)"""
         status = {}
@@ -3,8 +3,14 @@ SQLite database for persistence
 Stores positions, trades, and settings
 """
 import aiosqlite
-import json
-from typing import List, Dict, Optional
+import asyncio
+import orjson
+import time
+from cachetools import TTLCache
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, FrozenSet, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -13,28 +19,275 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Money columns stored as INTEGER cents; the public API still speaks dollars
+_CENTS_COLUMNS = frozenset({'strike', 'entry_price', 'price', 'pnl'})
+# Position/trade timestamps stored as INTEGER unix epoch milliseconds; rendered
+# back to ISO-8601 local time on read
+_EPOCH_MS_COLUMNS = frozenset({'created_at', 'updated_at'})
+
+
+def _now_ms() -> int:
+    """Current time as unix epoch milliseconds"""
+    return int(time.time() * 1000)
+
+
+def _to_cents(dollars: Optional[float]) -> Optional[int]:
+    """Convert a dollar amount to integer cents (None passes through)"""
+    return None if dollars is None else int(round(float(dollars) * 100))
+
+
+@lru_cache(maxsize=64)
+def _update_position_sql(columns: FrozenSet[str]) -> Tuple[Tuple[str, ...], str]:
+    """
+    Build (column order, UPDATE statement) for a set of position columns.
+    Memoized: callers update a handful of fixed column sets, so the SQL text is
+    built once per set and stays identical for sqlite3's statement cache.
+    """
+    ordered = tuple(sorted(columns))
+    set_clause = ', '.join(f"{column} = ?" for column in ordered)
+    return ordered, f'UPDATE positions SET {set_clause} WHERE id = ? AND user_id = ?'
+
+
+class Record(Mapping):
+    """
+    Read-only, dict-like view over a database row.
+    Columns are decoded on access (cents back to dollars, epoch ms to ISO-8601)
+    instead of copying every row into a dict; use to_dict() where a real dict is needed.
+    """
+
+    __slots__ = ('_row',)
+
+    def __init__(self, row: aiosqlite.Row):
+        self._row = row
+
+    def __getitem__(self, column: str) -> Any:
+        try:
+            value = self._row[column]
+        except IndexError:
+            raise KeyError(column) from None
+        if value is None:
+            return value
+        if column in _CENTS_COLUMNS:
+            return value / 100
+        if column in _EPOCH_MS_COLUMNS:
+            return datetime.fromtimestamp(value / 1000).isoformat(timespec='seconds')
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._row.keys())
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._row.keys()
+
+    def __repr__(self) -> str:
+        return f"Record({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        return dict(self)
+
 
 class Database:
     """Async SQLite database manager"""
 
+    # WAL lets readers run alongside the writer and turns each commit into a WAL
+    # append; synchronous=NORMAL only syncs at checkpoints (safe in WAL mode)
+    PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA cache_size=-65536',     # 64 MiB page cache
+        'PRAGMA mmap_size=268435456',   # 256 MiB memory-mapped I/O
+        'PRAGMA busy_timeout=3000',
+    )
+    MAINTENANCE_INTERVAL_SECONDS = 900  # PRAGMA optimize + WAL checkpoint every 15 minutes
+    # sqlite3 keeps compiled statements keyed by SQL text; sized to hold every fixed
+    # query plus the per-column-set UPDATE variants built by update_position
+    STATEMENT_CACHE_SIZE = 256
+    # Per-user read caches for dashboard polling; writes through this class
+    # invalidate them, the TTL bounds staleness from out-of-band writers
+    READ_CACHE_TTL_SECONDS = 2
+    READ_CACHE_MAX_USERS = 1024
+    # Read-only connections for SELECTs; under WAL they don't queue behind the writer
+    READER_CONNECTIONS = 4
+    # PRAGMA user_version; 1 = money columns stored as integer cents,
+    # 2 = positions/trades rebuilt with INTEGER cents and epoch-ms timestamps
+    SCHEMA_VERSION = 2
+    # Settings blobs larger than this are decoded in a worker thread
+    JSON_OFFLOAD_BYTES = 64 * 1024
+
     def __init__(self, db_path: str = None):
         self.db_path = db_path or settings.DATABASE_PATH
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn: Optional[aiosqlite.Connection] = None
+        self.conn: Optional[aiosqlite.Connection] = None  # Single read-write connection
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        self.maintenance_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._transaction_owner: Optional[asyncio.Task] = None
+        self._stats_cache: TTLCache = TTLCache(maxsize=self.READ_CACHE_MAX_USERS, ttl=self.READ_CACHE_TTL_SECONDS)
+        self._open_positions_cache: TTLCache = TTLCache(maxsize=self.READ_CACHE_MAX_USERS, ttl=self.READ_CACHE_TTL_SECONDS)
 
     async def connect(self):
         """Connect to database and create tables"""
-        self.conn = await aiosqlite.connect(self.db_path)
+        self.conn = await aiosqlite.connect(self.db_path, cached_statements=self.STATEMENT_CACHE_SIZE)
         self.conn.row_factory = aiosqlite.Row
+        for pragma in self.PRAGMAS:
+            await self.conn.execute(pragma)
         await self._create_tables()
+
+        # Readers are opened after WAL is enabled and the schema exists
+        self._idle_readers = asyncio.Queue()
+        for _ in range(self.READER_CONNECTIONS):
+            reader = await aiosqlite.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=self.STATEMENT_CACHE_SIZE
+            )
+            reader.row_factory = aiosqlite.Row
+            for pragma in self.PRAGMAS:
+                await reader.execute(pragma)
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
+        self.maintenance_task = asyncio.create_task(self._maintenance_loop())
         logger.info(f"✅ Connected to database: {self.db_path}")
 
     async def disconnect(self):
         """Close database connection"""
+        if self.maintenance_task:
+            self.maintenance_task.cancel()
+            self.maintenance_task = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._idle_readers = None
         if self.conn:
             await self.conn.close()
 
+    @asynccontextmanager
+    async def _read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow an idle read-only connection (waits if all are busy)"""
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Group writes into one transaction (a single commit/WAL sync).
+        Re-entrant within a task: nested blocks join the outer transaction.
+        """
+        if self._transaction_owner is asyncio.current_task():
+            yield
+            return
+
+        async with self._write_lock:
+            self._transaction_owner = asyncio.current_task()
+            try:
+                await self.conn.execute('BEGIN IMMEDIATE')
+                try:
+                    yield
+                except BaseException:
+                    await self.conn.rollback()
+                    raise
+                await self.conn.commit()
+            finally:
+                self._transaction_owner = None
+
+    def _invalidate_user(self, user_id: str):
+        """Drop cached reads for a user after their positions/trades change"""
+        self._stats_cache.pop(user_id, None)
+        self._open_positions_cache.pop(user_id, None)
+
+    async def _maintenance_loop(self):
+        """Periodically refresh query planner stats and truncate the WAL file"""
+        while True:
+            try:
+                await asyncio.sleep(self.MAINTENANCE_INTERVAL_SECONDS)
+                # Run between writes, never inside another task's open transaction
+                async with self._write_lock:
+                    await self.conn.execute('PRAGMA optimize')
+                    await self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Database maintenance failed: {e}")
+
     async def _create_tables(self):
+        """Create (or upgrade) the database schema in one transaction"""
+        async with self.transaction():
+            cursor = await self.conn.execute('PRAGMA user_version')
+            version = (await cursor.fetchone())[0]
+            cursor = await self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'positions'"
+            )
+            legacy = version < 2 and await cursor.fetchone() is not None
+
+            if legacy:
+                await self._detach_legacy_tables()
+            await self._create_schema()
+            if legacy:
+                await self._copy_legacy_rows(version)
+
+            if version < self.SCHEMA_VERSION:
+                await self.conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    async def _detach_legacy_tables(self):
+        """
+        Rename positions/trades out of the way so they can be recreated with the
+        current column types (SQLite can't change a column's type affinity in place)
+        """
+        for table in ('positions', 'trades'):
+            await self.conn.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+            cursor = await self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (f'{table}_legacy',)
+            )
+            for (index_name,) in await cursor.fetchall():
+                await self.conn.execute(f'DROP INDEX {index_name}')
+
+    async def _copy_legacy_rows(self, version: int):
+        """Copy rows from the legacy tables, converting money to cents and ISO timestamps to epoch ms"""
+        # Version 0 stored dollar amounts; version 1 already stored cents
+        scale = 100 if version < 1 else 1
+        # Legacy timestamps are local-time ISO strings
+        epoch_ms = "CAST(strftime('%s', {}, 'utc') AS INTEGER) * 1000"
+
+        await self.conn.execute(f'''
+            INSERT INTO positions (
+                id, user_id, ticker, decision, option_id, strike, expiration,
+                contracts, entry_price, take_profit, stop_loss, source,
+                strategy_used, created_at, updated_at, status
+            )
+            SELECT
+                id, user_id, ticker, decision, option_id,
+                CAST(ROUND(strike * {scale}) AS INTEGER), expiration,
+                contracts, CAST(ROUND(entry_price * {scale}) AS INTEGER),
+                take_profit, stop_loss, source, strategy_used,
+                {epoch_ms.format('created_at')}, {epoch_ms.format('updated_at')}, status
+            FROM positions_legacy
+        ''')
+        await self.conn.execute(f'''
+            INSERT INTO trades (
+                id, user_id, position_id, ticker, action, price, contracts, pnl, reason, created_at
+            )
+            SELECT
+                id, user_id, position_id, ticker, action,
+                CAST(ROUND(price * {scale}) AS INTEGER), contracts,
+                CAST(ROUND(pnl * {scale}) AS INTEGER), reason,
+                {epoch_ms.format('created_at')}
+            FROM trades_legacy
+        ''')
+        await self.conn.execute('DROP TABLE trades_legacy')
+        await self.conn.execute('DROP TABLE positions_legacy')
+        logger.info(f"Migrated positions/trades from schema v{version} to v{self.SCHEMA_VERSION}")
+
+    async def _create_schema(self):
         """Create database schema with multi-tenancy support"""
         # Sessions table for persistent authentication
         await self.conn.execute('''
@@ -55,16 +308,16 @@ class Database:
                 ticker TEXT NOT NULL,
                 decision TEXT NOT NULL,
                 option_id TEXT,
-                strike REAL NOT NULL,
+                strike INTEGER NOT NULL,
                 expiration TEXT NOT NULL,
                 contracts INTEGER NOT NULL,
-                entry_price REAL NOT NULL,
+                entry_price INTEGER NOT NULL,
                 take_profit REAL NOT NULL,
                 stop_loss REAL NOT NULL,
                 source TEXT DEFAULT 'bot',
                 strategy_used TEXT DEFAULT 'none',
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL,
                 status TEXT DEFAULT 'open'
             )
         ''')
@@ -73,8 +326,11 @@ class Database:
         await self.conn.execute('''
             CREATE INDEX IF NOT EXISTS idx_positions_user_id ON positions(user_id)
         ''')
+        # Partial index: closed positions dominate over time and are never listed
+        await self.conn.execute('DROP INDEX IF EXISTS idx_positions_user_status')
         await self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_positions_user_status ON positions(user_id, status)
+            CREATE INDEX IF NOT EXISTS idx_positions_open ON positions(user_id, created_at DESC)
+            WHERE status = 'open'
         ''')
 
         await self.conn.execute('''
@@ -84,11 +340,11 @@ class Database:
                 position_id TEXT NOT NULL,
                 ticker TEXT NOT NULL,
                 action TEXT NOT NULL,
-                price REAL NOT NULL,
+                price INTEGER NOT NULL,
                 contracts INTEGER NOT NULL,
-                pnl REAL,
+                pnl INTEGER,
                 reason TEXT,
-                created_at TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
                 FOREIGN KEY (position_id) REFERENCES positions(id)
             )
         ''')
@@ -96,12 +352,18 @@ class Database:
         await self.conn.execute('''
             CREATE INDEX IF NOT EXISTS idx_trades_user_id ON trades(user_id)
         ''')
+        await self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trades_user_pnl ON trades(user_id, pnl)
+        ''')
+        await self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trades_user_created ON trades(user_id, created_at DESC, id DESC)
+        ''')
 
         await self.conn.execute('''
             CREATE TABLE IF NOT EXISTS settings (
                 user_id TEXT NOT NULL,
                 key TEXT NOT NULL,
-                value TEXT NOT NULL,
+                value BLOB NOT NULL,
                 updated_at TEXT NOT NULL,
                 PRIMARY KEY (user_id, key)
             )
@@ -111,114 +373,194 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_settings_user_id ON settings(user_id)
         ''')
 
-        await self.conn.commit()
-
     # ========== Position Management ==========
 
     async def create_position(self, position: Dict, user_id: str) -> str:
         """Create new position for specific user"""
-        now = datetime.now().isoformat()
-        position_id = position['id']
-
-        await self.conn.execute('''
-            INSERT INTO positions (
-                id, user_id, ticker, decision, option_id, strike, expiration,
-                contracts, entry_price, take_profit, stop_loss, source,
-                strategy_used, created_at, updated_at, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            position_id,
-            user_id,
-            position['ticker'],
-            position['decision'],
-            position.get('option_id'),
-            position['strike'],
-            position['expiration'],
-            position['contracts'],
-            position['entry_price'],
-            position['take_profit'],
-            position['stop_loss'],
-            position.get('source', 'bot'),
-            position.get('strategy_used', 'none'),
-            now,
-            now,
-            'open'
-        ))
-        await self.conn.commit()
-        logger.info(f"Created position for {user_id}: {position_id} - {position['ticker']}")
-        return position_id
-
-    async def get_position(self, position_id: str, user_id: str) -> Optional[Dict]:
+        await self.create_positions([position], user_id)
+        logger.info(f"Created position for {user_id}: {position['id']} - {position['ticker']}")
+        return position['id']
+
+    async def create_positions(self, positions: List[Dict], user_id: str) -> List[str]:
+        """Create many positions for specific user in one transaction (bulk imports)"""
+        now = _now_ms()
+        rows = [
+            (
+                position['id'],
+                user_id,
+                position['ticker'],
+                position['decision'],
+                position.get('option_id'),
+                _to_cents(position['strike']),
+                position['expiration'],
+                position['contracts'],
+                _to_cents(position['entry_price']),
+                position['take_profit'],
+                position['stop_loss'],
+                position.get('source', 'bot'),
+                position.get('strategy_used', 'none'),
+                now,
+                now,
+                'open'
+            )
+            for position in positions
+        ]
+
+        async with self.transaction():
+            await self.conn.executemany('''
+                INSERT INTO positions (
+                    id, user_id, ticker, decision, option_id, strike, expiration,
+                    contracts, entry_price, take_profit, stop_loss, source,
+                    strategy_used, created_at, updated_at, status
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        self._invalidate_user(user_id)
+        return [row[0] for row in rows]
+
+    async def get_position(self, position_id: str, user_id: str) -> Optional[Record]:
         """Get position by ID for specific user"""
-        cursor = await self.conn.execute(
-            'SELECT * FROM positions WHERE id = ? AND user_id = ?',
-            (position_id, user_id)
-        )
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                'SELECT * FROM positions WHERE id = ? AND user_id = ?',
+                (position_id, user_id)
+            )
+            row = await cursor.fetchone()
 
         if row:
-            return dict(row)
+            return Record(row)
         return None
 
-    async def get_position_any_user(self, position_id: str) -> Optional[Dict]:
+    async def get_position_any_user(self, position_id: str) -> Optional[Record]:
         """Get position by ID without user filtering (for internal background services)"""
-        cursor = await self.conn.execute(
-            'SELECT * FROM positions WHERE id = ?',
-            (position_id,)
-        )
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                'SELECT * FROM positions WHERE id = ?',
+                (position_id,)
+            )
+            row = await cursor.fetchone()
 
         if row:
-            return dict(row)
+            return Record(row)
         return None
 
-    async def get_open_positions(self, user_id: str) -> List[Dict]:
+    async def get_position_settings(self, position_id: str, user_id: Optional[str] = None) -> Optional[Record]:
+        """
+        Get only the exit settings of a position (owner, TP/SL, strategy).
+        Pass user_id=None to skip user filtering (internal background services).
+        """
+        return (await self.get_positions_settings([position_id], user_id)).get(position_id)
+
+    async def get_positions_settings(self, position_ids: List[str], user_id: Optional[str] = None) -> Dict[str, Record]:
+        """
+        Get the exit settings (owner, TP/SL, strategy) of many positions in one query.
+        Hot path for position listing and background monitoring - avoids decoding full rows.
+        Pass user_id=None to skip user filtering (internal background services).
+
+        Returns:
+            {position_id: Record} for the positions that exist
+        """
+        if not position_ids:
+            return {}
+
+        placeholders = ', '.join('?' * len(position_ids))
+        sql = f'SELECT id, user_id, take_profit, stop_loss, strategy_used FROM positions WHERE id IN ({placeholders})'
+        params = list(position_ids)
+        if user_id is not None:
+            sql += ' AND user_id = ?'
+            params.append(user_id)
+
+        async with self._read() as conn:
+            cursor = await conn.execute(sql, params)
+            rows = await cursor.fetchall()
+
+        return {row['id']: Record(row) for row in rows}
+
+    async def get_open_positions(self, user_id: str) -> List[Record]:
         """Get all open positions for specific user"""
-        cursor = await self.conn.execute(
-            "SELECT * FROM positions WHERE user_id = ? AND status = 'open' ORDER BY created_at DESC",
-            (user_id,)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        positions = self._open_positions_cache.get(user_id)
+        if positions is None:
+            async with self._read() as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM positions WHERE user_id = ? AND status = 'open' ORDER BY created_at DESC",
+                    (user_id,)
+                )
+                rows = await cursor.fetchall()
+            positions = [Record(row) for row in rows]
+            self._open_positions_cache[user_id] = positions
+        # Records are read-only, so only the list needs copying
+        return list(positions)
 
     async def update_position(self, position_id: str, user_id: str, updates: Dict):
         """Update position fields for specific user"""
-        updates['updated_at'] = datetime.now().isoformat()
-
-        set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
-        values = list(updates.values()) + [position_id, user_id]
-
-        await self.conn.execute(
-            f'UPDATE positions SET {set_clause} WHERE id = ? AND user_id = ?',
-            values
-        )
-        await self.conn.commit()
+        updates['updated_at'] = _now_ms()
+        columns, sql = _update_position_sql(frozenset(updates))
+        values = [
+            _to_cents(updates[column]) if column in _CENTS_COLUMNS else updates[column]
+            for column in columns
+        ]
+        values += [position_id, user_id]
+
+        async with self.transaction():
+            await self.conn.execute(sql, values)
+        self._invalidate_user(user_id)
 
     async def close_position(self, position_id: str, user_id: str, exit_price: float, reason: str = None):
         """Close position and record trade for specific user"""
-        position = await self.get_position(position_id, user_id)
-        if not position:
-            raise ValueError(f"Position not found: {position_id}")
-
-        # Calculate P&L
-        pnl = (exit_price - position['entry_price']) * position['contracts'] * 100
-
-        # Update position status
-        await self.update_position(position_id, user_id, {'status': 'closed'})
-
-        # Record trade
-        await self.record_trade(
-            user_id=user_id,
-            position_id=position_id,
-            ticker=position['ticker'],
-            action='SELL',
-            price=exit_price,
-            contracts=position['contracts'],
-            pnl=pnl,
-            reason=reason
-        )
-
-        logger.info(f"Closed position for {user_id}: {position_id} - P&L: ${pnl:.2f}")
+        await self.close_positions([(position_id, user_id, exit_price, reason)])
+
+    async def close_positions(self, items: List[Tuple[str, str, float, Optional[str]]]):
+        """
+        Close many positions and record their trades in one transaction.
+
+        Args:
+            items: (position_id, user_id, exit_price, reason) tuples
+
+        Raises:
+            ValueError: if any position is not found (nothing is closed)
+        """
+        if not items:
+            return
+
+        async with self.transaction():
+            placeholders = ', '.join('?' * len(items))
+            cursor = await self.conn.execute(
+                f'SELECT id, user_id, ticker, contracts, entry_price FROM positions WHERE id IN ({placeholders})',
+                [position_id for position_id, _, _, _ in items]
+            )
+            positions = {(row['id'], row['user_id']): Record(row) for row in await cursor.fetchall()}
+
+            now = _now_ms()
+            updates = []
+            trades = []
+            for position_id, user_id, exit_price, reason in items:
+                position = positions.get((position_id, user_id))
+                if not position:
+                    raise ValueError(f"Position not found: {position_id}")
+
+                # Calculate P&L
+                pnl = (exit_price - position['entry_price']) * position['contracts'] * 100
+
+                updates.append((now, position_id, user_id))
+                trades.append({
+                    'user_id': user_id,
+                    'position_id': position_id,
+                    'ticker': position['ticker'],
+                    'action': 'SELL',
+                    'price': exit_price,
+                    'contracts': position['contracts'],
+                    'pnl': pnl,
+                    'reason': reason
+                })
+
+            await self.conn.executemany(
+                "UPDATE positions SET status = 'closed', updated_at = ? WHERE id = ? AND user_id = ?",
+                updates
+            )
+            await self.record_trades(trades)
+
+        for trade in trades:
+            self._invalidate_user(trade['user_id'])
+            logger.info(f"Closed position for {trade['user_id']}: {trade['position_id']} - P&L: ${trade['pnl']:.2f}")
 
     async def record_trade(
         self,
@@ -232,64 +574,92 @@ class Database:
         reason: Optional[str] = None
     ):
         """Record trade history for specific user"""
-        await self.conn.execute('''
-            INSERT INTO trades (
-                user_id, position_id, ticker, action, price, contracts, pnl, reason, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            user_id,
-            position_id,
-            ticker,
-            action,
-            price,
-            contracts,
-            pnl,
-            reason,
-            datetime.now().isoformat()
-        ))
-        await self.conn.commit()
-
-    async def get_trade_history(self, user_id: str, limit: int = 100) -> List[Dict]:
+        await self.record_trades([{
+            'user_id': user_id,
+            'position_id': position_id,
+            'ticker': ticker,
+            'action': action,
+            'price': price,
+            'contracts': contracts,
+            'pnl': pnl,
+            'reason': reason
+        }])
+
+    async def record_trades(self, trades: List[Dict]):
+        """
+        Record many trades in one transaction (bulk imports / trade replay).
+        Each dict takes the same fields as record_trade's arguments.
+        """
+        now = _now_ms()
+        rows = [
+            (
+                trade['user_id'],
+                trade['position_id'],
+                trade['ticker'],
+                trade['action'],
+                _to_cents(trade['price']),
+                trade['contracts'],
+                _to_cents(trade.get('pnl')),
+                trade.get('reason'),
+                now
+            )
+            for trade in trades
+        ]
+
+        async with self.transaction():
+            await self.conn.executemany('''
+                INSERT INTO trades (
+                    user_id, position_id, ticker, action, price, contracts, pnl, reason, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        for user_id in {row[0] for row in rows}:
+            self._invalidate_user(user_id)
+
+    async def get_trade_history(self, user_id: str, limit: int = 100) -> List[Record]:
         """Get trade history for specific user"""
-        cursor = await self.conn.execute(
-            'SELECT * FROM trades WHERE user_id = ? ORDER BY created_at DESC LIMIT ?',
-            (user_id, limit)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                'SELECT * FROM trades WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?',
+                (user_id, limit)
+            )
+            rows = await cursor.fetchall()
+        return [Record(row) for row in rows]
 
     # ========== Settings Management ==========
 
     async def get_performance_stats(self, user_id: str) -> Dict:
         """Calculate performance statistics for specific user"""
-        # Total P&L
-        cursor = await self.conn.execute(
-            'SELECT SUM(pnl) as total_pnl, COUNT(*) as total_trades FROM trades WHERE user_id = ? AND pnl IS NOT NULL',
-            (user_id,)
-        )
-        row = await cursor.fetchone()
-
-        total_pnl = row['total_pnl'] or 0
-        total_trades = row['total_trades'] or 0
+        stats = self._stats_cache.get(user_id)
+        if stats is not None:
+            return dict(stats)
+
+        # Total P&L, trade count and wins in one pass (index-only scan on idx_trades_user_pnl)
+        async with self._read() as conn:
+            cursor = await conn.execute('''
+                SELECT SUM(pnl) as total_pnl,
+                       COUNT(*) as total_trades,
+                       SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins
+                FROM trades WHERE user_id = ? AND pnl IS NOT NULL
+            ''', (user_id,))
+            row = await cursor.fetchone()
 
-        # Win rate
-        cursor = await self.conn.execute(
-            'SELECT COUNT(*) as wins FROM trades WHERE user_id = ? AND pnl > 0',
-            (user_id,)
-        )
-        wins = (await cursor.fetchone())['wins']
+        total_pnl = (row['total_pnl'] or 0) / 100
+        total_trades = row['total_trades'] or 0
+        wins = row['wins'] or 0
 
         win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
 
         # Average P&L
         avg_pnl = (total_pnl / total_trades) if total_trades > 0 else 0
 
-        return {
+        stats = {
             'total_pnl': total_pnl,
             'total_trades': total_trades,
             'win_rate': win_rate,
             'avg_pnl': avg_pnl
         }
+        self._stats_cache[user_id] = stats
+        return dict(stats)
 
     async def get_settings(self, user_id: str) -> Optional[Dict]:
         """
@@ -297,14 +667,18 @@ class Database:
         Returns None if no settings exist.
         """
         try:
-            cursor = await self.conn.execute(
-                'SELECT value FROM settings WHERE user_id = ? AND key = ?',
-                (user_id, 'app_settings')
-            )
-            row = await cursor.fetchone()
+            async with self._read() as conn:
+                cursor = await conn.execute(
+                    'SELECT value FROM settings WHERE user_id = ? AND key = ?',
+                    (user_id, 'app_settings')
+                )
+                row = await cursor.fetchone()
 
             if row:
-                return json.loads(row['value'])
+                value = row['value']  # bytes (orjson) or str (rows written before the switch)
+                if len(value) > self.JSON_OFFLOAD_BYTES:
+                    return await asyncio.to_thread(orjson.loads, value)
+                return orjson.loads(value)
             return None
 
         except Exception as e:
@@ -316,15 +690,17 @@ class Database:
         Save application settings to database for specific user.
         """
         try:
-            settings_json = json.dumps(settings_data)
+            settings_json = orjson.dumps(settings_data)
             now = datetime.utcnow().isoformat()
 
-            await self.conn.execute('''
-                INSERT OR REPLACE INTO settings (user_id, key, value, updated_at)
-                VALUES (?, ?, ?, ?)
-            ''', (user_id, 'app_settings', settings_json, now))
-
-            await self.conn.commit()
+            async with self.transaction():
+                await self.conn.execute('''
+                    INSERT INTO settings (user_id, key, value, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(user_id, key) DO UPDATE SET
+                        value = excluded.value,
+                        updated_at = excluded.updated_at
+                ''', (user_id, 'app_settings', settings_json, now))
             logger.info(f"Settings saved for {user_id}")
 
         except Exception as e:
@@ -16,7 +16,7 @@ Clean separation of concerns:
 """
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
@@ -70,8 +70,9 @@ app = FastAPI(
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=settings.CORS_ALLOW_ORIGINS,
+    # Credentialed requests must never be combined with a wildcard origin
+    allow_credentials="*" not in settings.CORS_ALLOW_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -82,11 +83,8 @@ app.add_middleware(
 # Register HTTP routes
 app.include_router(router)
 
-# Register WebSocket endpoint
-@app.websocket("/ws")
-async def ws_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time chat and updates"""
-    await websocket_endpoint(websocket)
+# Register WebSocket endpoint (real-time chat and updates)
+app.add_api_websocket_route("/ws", websocket_endpoint)
 
 
 # ========== DEV SERVER ==========
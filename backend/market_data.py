@@ -3,24 +3,85 @@ Optimized Market Data Layer with Redis Caching and Intelligent Fallback
 Supports stocks and index options (SPX, NDX, RUT, etc.)
 Automatically switches between yfinance, AlphaVantage, and Finnhub on rate limits
 """
+import ahocorasick
+import aiohttp
+import numpy as np
 import pandas as pd
 import ta
 import yfinance as yf
 import asyncio
-from typing import Optional, List, Dict
+import time
+from functools import lru_cache
+from typing import Optional, List, Dict, FrozenSet, Set, Tuple, Union
 import logging
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+from dateutil.tz import tzlocal
 
 from .cache import cache
 from .config import settings
 from .data_sources import DataSourceOrchestrator, RateLimitError
 
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+try:
+    from . import ta_numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Suppress yfinance debug/error logs to reduce noise
 logging.getLogger('yfinance').setLevel(logging.CRITICAL)
 
 
+def _format_publish_times(timestamps: List[int]) -> List[Optional[str]]:
+    """
+    Batch equivalent of datetime.fromtimestamp(t).isoformat() for unix timestamps
+    (local time, second precision); missing (0/None) timestamps map to None.
+    """
+    seconds = np.array([t or 0 for t in timestamps], dtype=np.int64)
+    local = pd.to_datetime(seconds, unit='s', utc=True).tz_convert(tzlocal())
+    formatted = local.strftime('%Y-%m-%dT%H:%M:%S')
+    return [iso if t else None for iso, t in zip(formatted, seconds)]
+
+
+def _build_keyword_automaton(groups: Dict[str, tuple], whole_words: FrozenSet[str]) -> ahocorasick.Automaton:
+    """
+    Build one Aho-Corasick automaton over all keyword groups
+    (payload: (group, keyword, must end a word)).
+    """
+    automaton = ahocorasick.Automaton()
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (group, keyword, keyword in whole_words))
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_keywords(automaton: ahocorasick.Automaton, text: str) -> Set[Tuple[str, str]]:
+    """
+    Distinct (group, keyword) hits in text. Keywords must start a word but may be
+    a prefix of it: 'rise' matches 'rises' but not 'enterprise', 'war' not 'software'.
+    Whole-word keywords must also end one ('up' doesn't match 'update'), and only the
+    longest hit starting at a position counts ('upgrade' is not also an 'up').
+    """
+    longest: Dict[int, Tuple[int, str, str]] = {}  # start -> (end, group, keyword)
+    for end, (group, keyword, whole_word) in automaton.iter(text):
+        start = end - len(keyword) + 1
+        if start > 0 and text[start - 1].isalnum():
+            continue
+        if whole_word and end + 1 < len(text) and text[end + 1].isalnum():
+            continue
+        if start not in longest or longest[start][0] < end:
+            longest[start] = (end, group, keyword)
+    return {(group, keyword) for _, group, keyword in longest.values()}
+
+
 class MarketData:
     """Market data fetcher with intelligent caching"""
 
@@ -33,18 +94,64 @@ class MarketData:
         'DJI': '^DJI',   # Dow Jones Industrial
     }
 
+    # Yahoo predefined screener endpoint
+    SCREENER_URL = "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved"
+    SCREENER_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    SCREENER_TIMEOUT_SECONDS = 5
+
+    # In-process cache in front of Redis for hot tickers (kept shorter than
+    # CACHE_TTL_MARKET_DATA so processes don't drift far from the shared cache)
+    STOCK_DATA_L1_TTL_SECONDS = 60
+    STOCK_DATA_L1_MAX_ENTRIES = 256
+
     def __init__(self):
         # Initialize intelligent fallback orchestrator
         self.orchestrator = DataSourceOrchestrator(
             alpha_vantage_key=settings.ALPHA_VANTAGE_API_KEY,
-            finnhub_key=settings.FINNHUB_API_KEY
+            finnhub_key=settings.FINNHUB_API_KEY,
+            cache_dir=settings.DATA_SOURCE_CACHE_DIR,
+            live_history_ttl=settings.CACHE_TTL_MARKET_DATA
         )
+        self._stock_data_l1 = TTLCache(maxsize=self.STOCK_DATA_L1_MAX_ENTRIES, ttl=self.STOCK_DATA_L1_TTL_SECONDS)
+
+        # Single-pass keyword matchers for news titles
+        self._sentiment_automaton = _build_keyword_automaton({
+            'positive': self.POSITIVE_WORDS,
+            'negative': self.NEGATIVE_WORDS,
+        }, self.WHOLE_WORD_KEYWORDS)
+        self._category_automaton = _build_keyword_automaton(self.CATEGORY_KEYWORDS, self.WHOLE_WORD_KEYWORDS)
+
+        # Keep-alive HTTP session for direct Yahoo calls (screener), created on first use
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info("MarketData initialized with intelligent fallback system")
 
-    def _normalize_ticker(self, ticker: str) -> str:
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get (or lazily create) the HTTP session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            self._http = aiohttp.ClientSession(
+                headers=self.SCREENER_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.SCREENER_TIMEOUT_SECONDS)
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self):
+        """Close HTTP sessions (own and data sources')"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        await self.orchestrator.aclose()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_ticker(ticker: str) -> str:
         """Normalize ticker (handle index symbols)"""
         ticker_upper = ticker.upper()
-        return self.INDEX_MAPPINGS.get(ticker_upper, ticker_upper)
+        return MarketData.INDEX_MAPPINGS.get(ticker_upper, ticker_upper)
 
     def _is_valid_ticker(self, ticker: str) -> bool:
         """
@@ -79,19 +186,28 @@ class MarketData:
             DataFrame with OHLCV + technical indicators or None
         """
         normalized_ticker = self._normalize_ticker(ticker)
-        cache_key = f"market_data:{normalized_ticker}"
 
-        # Try cache first
-        if use_cache:
-            cached = await cache.get(cache_key)
-            if cached:
-                logger.debug(f"Cache HIT: {normalized_ticker}")
-                # Reconstruct DataFrame
-                df = pd.DataFrame(cached['data'])
-                df.index = pd.to_datetime(cached['index'])
-                return df
+        if not use_cache:
+            return await self._fetch_stock_data(normalized_ticker)
+
+        # Hot tickers are served from process memory without a Redis round trip
+        df = self._stock_data_l1.get(normalized_ticker)
+        if df is not None:
+            return df
+
+        # Concurrent misses for the same ticker share one upstream fetch
+        df = await cache.get_or_set(
+            f"market_data:{normalized_ticker}",
+            settings.CACHE_TTL_MARKET_DATA,
+            lambda: self._fetch_stock_data(normalized_ticker)
+        )
+        if df is not None:
+            self._stock_data_l1[normalized_ticker] = df
+        return df
 
-        logger.debug(f"Cache MISS: {normalized_ticker} - fetching with intelligent fallback")
+    async def _fetch_stock_data(self, normalized_ticker: str) -> Optional[pd.DataFrame]:
+        """Fetch historical data via the orchestrator and add technical indicators"""
+        logger.debug(f"Fetching {normalized_ticker} with intelligent fallback")
 
         # Fetch using orchestrator (tries yfinance first, then fallbacks)
         try:
@@ -102,17 +218,7 @@ class MarketData:
                 return None
 
             # Add technical indicators
-            df = self._add_technical_indicators(df)
-
-            # Cache for 5 minutes
-            if use_cache:
-                cache_data = {
-                    'data': df.to_dict('records'),
-                    'index': df.index.astype(str).tolist()
-                }
-                await cache.set(cache_key, cache_data, settings.CACHE_TTL_MARKET_DATA)
-
-            return df
+            return self._add_technical_indicators(df)
 
         except Exception as e:
             logger.error(f"Error fetching data for {normalized_ticker}: {e}")
@@ -126,117 +232,207 @@ class MarketData:
         if len(df) < 200:
             logger.warning(f"Only {len(df)} rows - some indicators may be incomplete")
 
-        # Momentum Indicators
-        df['RSI'] = ta.momentum.RSIIndicator(df['Close'], window=14).rsi()
+        # Indices (e.g. VIX) report all-zero volume (NaN counts as no volume, as with sum())
+        has_volume = 'Volume' in df.columns and bool((df['Volume'].to_numpy() > 0).any())
+        if TALIB_AVAILABLE:
+            indicators = self._talib_indicators(df, has_volume)
+        else:
+            indicators = self._ta_indicators(df, has_volume)
+
+        # Join all indicator columns in one concat instead of ~20 column inserts
+        return pd.concat([df, pd.DataFrame(indicators, index=df.index)], axis=1)
+
+    def _talib_indicators(self, df: pd.DataFrame, has_volume: bool) -> Dict[str, np.ndarray]:
+        """Compute indicators with TA-Lib (native C) on contiguous float64 arrays"""
+        close = df['Close'].to_numpy(dtype=np.float64)
+        high = df['High'].to_numpy(dtype=np.float64)
+        low = df['Low'].to_numpy(dtype=np.float64)
+
+        # Fast stochastic: raw %K and its 3-period SMA (same as ta's stoch/stoch_signal)
+        stoch_k, stoch_d = talib.STOCHF(high, low, close, fastk_period=14, fastd_period=3, fastd_matype=0)
+        macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+        bb_high, bb_mid, bb_low = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)
+
+        return {
+            # Momentum Indicators
+            'RSI': talib.RSI(close, timeperiod=14),
+            'Stoch_K': stoch_k,
+            'Stoch_D': stoch_d,
+            # MACD
+            'MACD': macd,
+            'MACD_signal': macd_signal,
+            'MACD_hist': macd_hist,
+            # Moving Averages
+            'SMA_20': talib.SMA(close, timeperiod=20),
+            'SMA_50': talib.SMA(close, timeperiod=50),
+            'SMA_200': talib.SMA(close, timeperiod=200),
+            'EMA_12': talib.EMA(close, timeperiod=12),
+            'EMA_26': talib.EMA(close, timeperiod=26),
+            # Bollinger Bands (critical for volatility analysis)
+            'BB_High': bb_high,
+            'BB_Mid': bb_mid,
+            'BB_Low': bb_low,
+            'BB_Width': (bb_high - bb_low) / bb_mid * 100,
+            # ATR (Average True Range)
+            'ATR': talib.ATR(high, low, close, timeperiod=14),
+            # Volume indicators (if volume exists)
+            'OBV': talib.OBV(close, df['Volume'].to_numpy(dtype=np.float64)) if has_volume else None,
+            # ADX (Average Directional Index)
+            'ADX': talib.ADX(high, low, close, timeperiod=14),
+            'ADX_Pos': talib.PLUS_DI(high, low, close, timeperiod=14),
+            'ADX_Neg': talib.MINUS_DI(high, low, close, timeperiod=14),
+        }
 
-        # Stochastic Oscillator
+    def _ta_indicators(self, df: pd.DataFrame, has_volume: bool) -> Dict[str, Union[pd.Series, np.ndarray]]:
+        """
+        Compute indicators with the pure-Python `ta` library (fallback when TA-Lib is missing).
+        ATR and ADX - the Python-loop indicators in `ta` - use the numba kernels when available.
+        """
         stoch = ta.momentum.StochasticOscillator(df['High'], df['Low'], df['Close'])
-        df['Stoch_K'] = stoch.stoch()
-        df['Stoch_D'] = stoch.stoch_signal()
-
-        # MACD
         macd = ta.trend.MACD(df['Close'])
-        df['MACD'] = macd.macd()
-        df['MACD_signal'] = macd.macd_signal()
-        df['MACD_hist'] = macd.macd_diff()
-
-        # Moving Averages
-        df['SMA_20'] = ta.trend.SMAIndicator(df['Close'], window=20).sma_indicator()
-        df['SMA_50'] = ta.trend.SMAIndicator(df['Close'], window=50).sma_indicator()
-        df['SMA_200'] = ta.trend.SMAIndicator(df['Close'], window=200).sma_indicator()
-        df['EMA_12'] = ta.trend.EMAIndicator(df['Close'], window=12).ema_indicator()
-        df['EMA_26'] = ta.trend.EMAIndicator(df['Close'], window=26).ema_indicator()
-
-        # Bollinger Bands (critical for volatility analysis)
         bollinger = ta.volatility.BollingerBands(df['Close'])
-        df['BB_High'] = bollinger.bollinger_hband()
-        df['BB_Mid'] = bollinger.bollinger_mavg()
-        df['BB_Low'] = bollinger.bollinger_lband()
-        df['BB_Width'] = bollinger.bollinger_wband()
-
-        # ATR (Average True Range)
-        df['ATR'] = ta.volatility.AverageTrueRange(
-            df['High'], df['Low'], df['Close']
-        ).average_true_range()
-
-        # Volume indicators (if volume exists)
-        if 'Volume' in df.columns and df['Volume'].sum() > 0:
-            df['OBV'] = ta.volume.OnBalanceVolumeIndicator(
-                df['Close'], df['Volume']
-            ).on_balance_volume()
-        else:
-            df['OBV'] = None
-
-        # ADX (Average Directional Index)
-        adx = ta.trend.ADXIndicator(df['High'], df['Low'], df['Close'])
-        df['ADX'] = adx.adx()
-        df['ADX_Pos'] = adx.adx_pos()
-        df['ADX_Neg'] = adx.adx_neg()
 
-        return df
+        if NUMBA_AVAILABLE:
+            high = df['High'].to_numpy(dtype=np.float64)
+            low = df['Low'].to_numpy(dtype=np.float64)
+            close = df['Close'].to_numpy(dtype=np.float64)
+            atr = ta_numba.atr(high, low, close, 14)
+            adx, adx_pos, adx_neg = ta_numba.adx(high, low, close, 14)
+        else:
+            atr = ta.volatility.AverageTrueRange(df['High'], df['Low'], df['Close']).average_true_range()
+            adx_indicator = ta.trend.ADXIndicator(df['High'], df['Low'], df['Close'])
+            adx, adx_pos, adx_neg = adx_indicator.adx(), adx_indicator.adx_pos(), adx_indicator.adx_neg()
+
+        return {
+            # Momentum Indicators
+            'RSI': ta.momentum.RSIIndicator(df['Close'], window=14).rsi(),
+            'Stoch_K': stoch.stoch(),
+            'Stoch_D': stoch.stoch_signal(),
+            # MACD
+            'MACD': macd.macd(),
+            'MACD_signal': macd.macd_signal(),
+            'MACD_hist': macd.macd_diff(),
+            # Moving Averages
+            'SMA_20': ta.trend.SMAIndicator(df['Close'], window=20).sma_indicator(),
+            'SMA_50': ta.trend.SMAIndicator(df['Close'], window=50).sma_indicator(),
+            'SMA_200': ta.trend.SMAIndicator(df['Close'], window=200).sma_indicator(),
+            'EMA_12': ta.trend.EMAIndicator(df['Close'], window=12).ema_indicator(),
+            'EMA_26': ta.trend.EMAIndicator(df['Close'], window=26).ema_indicator(),
+            # Bollinger Bands (critical for volatility analysis)
+            'BB_High': bollinger.bollinger_hband(),
+            'BB_Mid': bollinger.bollinger_mavg(),
+            'BB_Low': bollinger.bollinger_lband(),
+            'BB_Width': bollinger.bollinger_wband(),
+            # ATR (Average True Range)
+            'ATR': atr,
+            # Volume indicators (if volume exists)
+            'OBV': ta.volume.OnBalanceVolumeIndicator(df['Close'], df['Volume']).on_balance_volume() if has_volume else None,
+            # ADX (Average Directional Index)
+            'ADX': adx,
+            'ADX_Pos': adx_pos,
+            'ADX_Neg': adx_neg,
+        }
 
     # High-quality news sources (prioritized)
-    TRUSTED_SOURCES = {
+    TRUSTED_SOURCES = frozenset({
         'Reuters', 'Bloomberg', 'The Wall Street Journal', 'Financial Times',
         'CNBC', 'MarketWatch', 'Barron\'s', 'Seeking Alpha', 'The Motley Fool',
         'Yahoo Finance', 'Benzinga', 'Zacks', 'InvestorPlace'
+    })
+
+    # Source quality score (1.0 for trusted, 0.7 for others)
+    SOURCE_QUALITY = {source: 1.0 for source in TRUSTED_SOURCES}
+    DEFAULT_SOURCE_QUALITY = 0.7
+
+    def _source_qualities(self, publishers: List[str]) -> np.ndarray:
+        """Source quality score per publisher (one dict lookup each)"""
+        quality = self.SOURCE_QUALITY.get
+        return np.fromiter(
+            (quality(p, self.DEFAULT_SOURCE_QUALITY) for p in publishers), dtype=float, count=len(publishers)
+        )
+
+    # Short stems that only match as whole words ('up' not 'update', 'miss' not 'mission')
+    WHOLE_WORD_KEYWORDS = frozenset({'up', 'down', 'low', 'high', 'cut', 'miss', 'war', 'fed'})
+
+    # Sentiment keywords (word-start matches in lowercased titles, see _match_keywords)
+    POSITIVE_WORDS = (
+        'surge', 'soar', 'jump', 'rally', 'gain', 'rise', 'up', 'high', 'record',
+        'beat', 'exceed', 'strong', 'growth', 'profit', 'upgrade', 'bullish',
+        'breakthrough', 'partnership', 'acquisition', 'innovation', 'success',
+        'positive', 'outperform', 'boost', 'momentum', 'advance'
+    )
+    NEGATIVE_WORDS = (
+        'plunge', 'crash', 'fall', 'drop', 'decline', 'down', 'low', 'loss',
+        'miss', 'weak', 'concern', 'worry', 'risk', 'downgrade', 'bearish',
+        'warning', 'cut', 'slash', 'investigation', 'lawsuit', 'failure',
+        'negative', 'underperform', 'tumble', 'slump', 'retreat'
+    )
+
+    # Market news categories in priority order (first matching category wins)
+    CATEGORY_KEYWORDS = {
+        'Fed/Central Bank': (
+            'fed', 'federal reserve', 'fomc', 'powell', 'interest rate',
+            'rate decision', 'central bank', 'monetary policy', 'rate cut', 'rate hike'
+        ),
+        'Macro Data': (
+            'jobs report', 'unemployment', 'nonfarm payroll', 'nfp', 'cpi',
+            'inflation', 'ppi', 'gdp', 'retail sales', 'consumer', 'pce',
+            'housing starts', 'jobless claims', 'economic data'
+        ),
+        'Corporate Catalyst': (
+            'earnings', 'guidance', 'fda approval', 'merger', 'acquisition',
+            'm&a', 'buyout', 'ipo', 'analyst upgrade', 'analyst downgrade',
+            'revenue', 'profit', 'eps', 'miss', 'beat'
+        ),
+        'Geopolitical': (
+            'china', 'russia', 'war', 'tariff', 'trade war', 'sanction',
+            'geopolit', 'military', 'conflict', 'treaty', 'trade deal',
+            'regulation', 'antitrust', 'investigation'
+        ),
     }
 
-    def _calculate_sentiment_score(self, title: str) -> float:
+    def _calculate_sentiment_scores(self, titles: List[str]) -> np.ndarray:
         """
-        Calculate basic sentiment score from news title.
-        Returns: -1.0 (very negative) to +1.0 (very positive)
+        Calculate basic sentiment scores for a batch of news titles.
+        Returns: -1.0 (very negative) to +1.0 (very positive) per title
         """
-        title_lower = title.lower()
-
-        # Positive keywords
-        positive_words = [
-            'surge', 'soar', 'jump', 'rally', 'gain', 'rise', 'up', 'high', 'record',
-            'beat', 'exceed', 'strong', 'growth', 'profit', 'upgrade', 'bullish',
-            'breakthrough', 'partnership', 'acquisition', 'innovation', 'success',
-            'positive', 'outperform', 'boost', 'momentum', 'advance'
-        ]
-
-        # Negative keywords
-        negative_words = [
-            'plunge', 'crash', 'fall', 'drop', 'decline', 'down', 'low', 'loss',
-            'miss', 'weak', 'concern', 'worry', 'risk', 'downgrade', 'bearish',
-            'warning', 'cut', 'slash', 'investigation', 'lawsuit', 'failure',
-            'negative', 'underperform', 'tumble', 'slump', 'retreat'
-        ]
-
-        positive_count = sum(1 for word in positive_words if word in title_lower)
-        negative_count = sum(1 for word in negative_words if word in title_lower)
-
-        # Calculate score
-        total = positive_count + negative_count
-        if total == 0:
-            return 0.0  # Neutral
-
-        score = (positive_count - negative_count) / total
-        return max(-1.0, min(1.0, score))
-
-    def _calculate_time_decay_weight(self, published_timestamp: int) -> float:
+        positive_counts = np.zeros(len(titles))
+        negative_counts = np.zeros(len(titles))
+        for i, title in enumerate(titles):
+            # One automaton pass; each keyword counts once however often it appears
+            matched = _match_keywords(self._sentiment_automaton, title.lower())
+            positive_counts[i] = sum(1 for group, _ in matched if group == 'positive')
+            negative_counts[i] = len(matched) - positive_counts[i]
+
+        # Calculate scores (titles without keywords are neutral)
+        total = positive_counts + negative_counts
+        scores = np.divide(positive_counts - negative_counts, total, out=np.zeros(len(titles)), where=total > 0)
+        return np.clip(scores, -1.0, 1.0)
+
+    # e^(-age/24) sampled hourly over one week (news older than ~55h is clamped to 0.1 anyway)
+    TIME_DECAY_MAX_HOURS = 168
+    TIME_DECAY_HOURS = np.arange(TIME_DECAY_MAX_HOURS + 1, dtype=float)
+    TIME_DECAY_LUT = np.exp(-TIME_DECAY_HOURS / 24.0)
+
+    def _calculate_time_decay_weights(self, published_timestamps: List[int]) -> np.ndarray:
         """
-        Calculate time decay weight for news relevance.
+        Calculate time decay weights for news relevance.
         Recent news (< 24h) = 1.0, older news decays exponentially.
         """
-        if not published_timestamp:
-            return 0.5  # Unknown time = medium weight
+        timestamps = np.array(
+            [t if isinstance(t, (int, float)) else 0 for t in published_timestamps], dtype=float
+        )
+        age_hours = (time.time() - timestamps) / 3600
 
-        try:
-            published_dt = datetime.fromtimestamp(published_timestamp)
-            age_hours = (datetime.now() - published_dt).total_seconds() / 3600
-
-            # Exponential decay: weight = e^(-age/24)
-            # News < 24h old: weight ≈ 1.0
-            # News 48h old: weight ≈ 0.37
-            # News 72h old: weight ≈ 0.14
-            import math
-            weight = math.exp(-age_hours / 24)
-            return max(0.1, min(1.0, weight))  # Clamp between 0.1 and 1.0
-        except:
-            return 0.5
+        # Exponential decay: weight = e^(-age/24), linearly interpolated from the hourly table
+        # News < 24h old: weight ≈ 1.0
+        # News 48h old: weight ≈ 0.37
+        # News 72h old: weight ≈ 0.14
+        weights = np.interp(age_hours, self.TIME_DECAY_HOURS, self.TIME_DECAY_LUT)
+        weights = np.clip(weights, 0.1, 1.0)  # Clamp between 0.1 and 1.0
+
+        # Unknown time = medium weight
+        return np.where(timestamps == 0, 0.5, weights)
 
     async def get_news(self, ticker: str, use_cache: bool = True) -> List[Dict]:
         """
@@ -269,45 +465,36 @@ class MarketData:
             raw_news = await self.orchestrator.get_news(normalized_ticker)
 
             if raw_news and isinstance(raw_news, list):
-                for n in raw_news[:15]:  # Fetch more, filter later
-                    if not isinstance(n, dict):
-                        continue
-
-                    publisher = n.get('publisher', 'Unknown')
-                    title = n.get('title', 'No title')
-                    published_time = n.get('published', 0)
-
-                    # Calculate sentiment score
-                    sentiment_score = self._calculate_sentiment_score(title)
-
-                    # Calculate time decay weight
-                    time_weight = self._calculate_time_decay_weight(published_time)
-
-                    # Source quality score (1.0 for trusted, 0.7 for others)
-                    source_quality = 1.0 if publisher in self.TRUSTED_SOURCES else 0.7
-
-                    # Overall relevance score (combines time and source quality)
-                    relevance_score = time_weight * source_quality
-
-                    news_item = {
-                        'title': title,
-                        'publisher': publisher,
+                articles = [n for n in raw_news[:15] if isinstance(n, dict)]  # Fetch more, filter later
+                titles = [n.get('title', 'No title') for n in articles]
+                publishers = [n.get('publisher', 'Unknown') for n in articles]
+                published_times = [n.get('published', 0) for n in articles]
+
+                # Score the whole batch as columns: sentiment, time decay weight, source quality
+                sentiment_scores = self._calculate_sentiment_scores(titles)
+                time_weights = self._calculate_time_decay_weights(published_times)
+                source_qualities = self._source_qualities(publishers)
+
+                # Overall relevance score (combines time and source quality)
+                relevance_scores = np.round(time_weights * source_qualities, 2)
+
+                # Keep the 10 most relevant (most relevant first); only those become dicts
+                top = np.argsort(-relevance_scores, kind='stable')[:10].tolist()
+                published_isos = _format_publish_times([published_times[i] for i in top])
+
+                for i, published_iso in zip(top, published_isos):
+                    n = articles[i]
+                    news_list.append({
+                        'title': titles[i],
+                        'publisher': publishers[i],
                         'link': n.get('link', ''),
-                        'published': datetime.fromtimestamp(published_time).isoformat() if published_time else None,
-                        'sentiment_score': round(sentiment_score, 2),
-                        'time_weight': round(time_weight, 2),
-                        'source_quality': source_quality,
-                        'relevance_score': round(relevance_score, 2),
+                        'published': published_iso,
+                        'sentiment_score': round(float(sentiment_scores[i]), 2),
+                        'time_weight': round(float(time_weights[i]), 2),
+                        'source_quality': float(source_qualities[i]),
+                        'relevance_score': float(relevance_scores[i]),
                         'summary': n.get('summary', '')[:200] if n.get('summary') else ''  # First 200 chars
-                    }
-
-                    news_list.append(news_item)
-
-                # Sort by relevance score (most relevant first)
-                news_list.sort(key=lambda x: x['relevance_score'], reverse=True)
-
-                # Keep top 10 most relevant
-                news_list = news_list[:10]
+                    })
 
             # Cache for 10 minutes
             if use_cache:
@@ -351,6 +538,35 @@ class MarketData:
 
         return None
 
+    async def get_realtime_quotes(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for many tickers at once (same 1-minute cache as
+        get_realtime_quote). Cache misses are fetched together rather than
+        one request per ticker.
+
+        Args:
+            tickers: Stock/Index symbols
+
+        Returns:
+            {normalized ticker: price} for the tickers that could be priced
+        """
+        normalized_tickers = list(dict.fromkeys(self._normalize_ticker(t) for t in tickers))
+        cached = await asyncio.gather(*(cache.get(f"quote:{t}") for t in normalized_tickers))
+        quotes = {t: float(price) for t, price in zip(normalized_tickers, cached) if price}
+
+        missing = [t for t in normalized_tickers if t not in quotes]
+        if missing:
+            try:
+                fetched = await self.orchestrator.get_quotes(missing)
+                await asyncio.gather(*(
+                    cache.set(f"quote:{t}", price, settings.CACHE_TTL_QUOTE) for t, price in fetched.items()
+                ))
+                quotes.update({t: float(price) for t, price in fetched.items()})
+            except Exception as e:
+                logger.error(f"Error fetching quotes for {', '.join(missing)}: {e}")
+
+        return quotes
+
     async def get_market_news(self, use_cache: bool = True) -> List[Dict]:
         """
         Fetch market-wide news covering macroeconomic events, Fed decisions,
@@ -378,70 +594,59 @@ class MarketData:
 
         # Fetch news from major market indices and economic indicators
         market_tickers = ['^GSPC', '^DJI', '^IXIC', '^VIX']  # S&P 500, Dow, NASDAQ, VIX
-        all_news = []
 
         try:
-            for ticker_symbol in market_tickers:
-                try:
-                    # Use orchestrator for market news (with fallback)
-                    raw_news = await self.orchestrator.get_news(ticker_symbol)
-
-                    if raw_news and isinstance(raw_news, list):
-                        for n in raw_news[:10]:  # Top 10 from each index
-                            if not isinstance(n, dict):
-                                continue
-
-                            title = n.get('title', '')
-                            publisher = n.get('publisher', 'Unknown')
-                            published_time = n.get('published', 0)
-
-                            # Categorize news type based on keywords
-                            category = self._categorize_market_news(title)
-
-                            # Calculate sentiment
-                            sentiment_score = self._calculate_sentiment_score(title)
-
-                            # Time decay weight
-                            time_weight = self._calculate_time_decay_weight(published_time)
-
-                            # Source quality
-                            source_quality = 1.0 if publisher in self.TRUSTED_SOURCES else 0.7
-
-                            # Overall relevance (boost for high-impact categories)
-                            impact_multiplier = 1.5 if category in ['Fed/Central Bank', 'Macro Data'] else 1.0
-                            relevance_score = time_weight * source_quality * impact_multiplier
-
-                            news_item = {
-                                'title': title,
-                                'publisher': publisher,
-                                'link': n.get('link', ''),
-                                'published': datetime.fromtimestamp(published_time).isoformat() if published_time else None,
-                                'sentiment_score': round(sentiment_score, 2),
-                                'category': category,
-                                'relevance_score': round(relevance_score, 2),
-                                'summary': n.get('summary', '')[:200] if n.get('summary') else ''
-                            }
-
-                            all_news.append(news_item)
-
-                except Exception as e:
-                    logger.debug(f"Failed to fetch news from {ticker_symbol}: {e}")
-                    continue
-
-            # Remove duplicates (same title)
+            # Batch: a source rate limited for one index is skipped for the rest
+            async with self.orchestrator.batch():
+                per_index_news = await asyncio.gather(
+                    *(self._fetch_index_news(ticker_symbol) for ticker_symbol in market_tickers)
+                )
+            articles = [n for index_news in per_index_news for n in index_news]
+
+            # Remove duplicates (same title) - keep 64-bit title hashes, not the lowered strings
             seen_titles = set()
-            unique_news = []
-            for item in all_news:
-                title_lower = item['title'].lower()
-                if title_lower not in seen_titles:
-                    seen_titles.add(title_lower)
-                    unique_news.append(item)
-
-            # Sort by relevance score
-            unique_news.sort(key=lambda x: x['relevance_score'], reverse=True)
-
-            # Keep top 15 most relevant market news
-            market_news = unique_news[:15]
+            unique_articles = []
+            for n in articles:
+                title_key = hash(n.get('title', '').lower())
+                if title_key not in seen_titles:
+                    seen_titles.add(title_key)
+                    unique_articles.append(n)
+
+            titles = [n.get('title', '') for n in unique_articles]
+            publishers = [n.get('publisher', 'Unknown') for n in unique_articles]
+            published_times = [n.get('published', 0) for n in unique_articles]
+
+            # Categorize news type based on keywords
+            categories = [self._categorize_market_news(title) for title in titles]
+
+            # Score the whole batch as columns: sentiment, time decay weight, source quality
+            sentiment_scores = self._calculate_sentiment_scores(titles)
+            time_weights = self._calculate_time_decay_weights(published_times)
+            source_qualities = self._source_qualities(publishers)
+
+            # Overall relevance (boost for high-impact categories)
+            impact_multipliers = np.array(
+                [1.5 if category in ['Fed/Central Bank', 'Macro Data'] else 1.0 for category in categories]
+            )
+            relevance_scores = np.round(time_weights * source_qualities * impact_multipliers, 2)
+
+            # Keep top 15 most relevant market news; only those become dicts
+            top = np.argsort(-relevance_scores, kind='stable')[:15].tolist()
+            published_isos = _format_publish_times([published_times[i] for i in top])
+
+            market_news = []
+            for i, published_iso in zip(top, published_isos):
+                n = unique_articles[i]
+                market_news.append({
+                    'title': titles[i],
+                    'publisher': publishers[i],
+                    'link': n.get('link', ''),
+                    'published': published_iso,
+                    'sentiment_score': round(float(sentiment_scores[i]), 2),
+                    'category': categories[i],
+                    'relevance_score': float(relevance_scores[i]),
+                    'summary': n.get('summary', '')[:200] if n.get('summary') else ''
+                })
 
             # Cache for 15 minutes
             if use_cache and market_news:
@@ -453,6 +658,20 @@ class MarketData:
             logger.error(f"Error fetching market-wide news: {e}")
             return []
 
+    async def _fetch_index_news(self, ticker_symbol: str) -> List[Dict]:
+        """Fetch raw market-wide news articles for one index ticker"""
+        try:
+            # Use orchestrator for market news (with fallback)
+            raw_news = await self.orchestrator.get_news(ticker_symbol)
+
+            if raw_news and isinstance(raw_news, list):
+                return [n for n in raw_news[:10] if isinstance(n, dict)]  # Top 10 from each index
+
+        except Exception as e:
+            logger.debug(f"Failed to fetch news from {ticker_symbol}: {e}")
+
+        return []
+
     def _categorize_market_news(self, title: str) -> str:
         """
         Categorize news into market-moving event types.
@@ -460,34 +679,10 @@ class MarketData:
         Returns category: Fed/Central Bank, Macro Data, Corporate Catalyst,
                          Geopolitical, or General Market
         """
-        title_lower = title.lower()
-
-        # Fed/Central Bank keywords
-        fed_keywords = ['fed', 'federal reserve', 'fomc', 'powell', 'interest rate',
-                       'rate decision', 'central bank', 'monetary policy', 'rate cut', 'rate hike']
-        if any(kw in title_lower for kw in fed_keywords):
-            return 'Fed/Central Bank'
-
-        # Macroeconomic data keywords
-        macro_keywords = ['jobs report', 'unemployment', 'nonfarm payroll', 'nfp', 'cpi',
-                         'inflation', 'ppi', 'gdp', 'retail sales', 'consumer', 'pce',
-                         'housing starts', 'jobless claims', 'economic data']
-        if any(kw in title_lower for kw in macro_keywords):
-            return 'Macro Data'
-
-        # Corporate catalyst keywords
-        corporate_keywords = ['earnings', 'guidance', 'fda approval', 'merger', 'acquisition',
-                             'm&a', 'buyout', 'ipo', 'analyst upgrade', 'analyst downgrade',
-                             'revenue', 'profit', 'eps', 'miss', 'beat']
-        if any(kw in title_lower for kw in corporate_keywords):
-            return 'Corporate Catalyst'
-
-        # Geopolitical keywords
-        geo_keywords = ['china', 'russia', 'war', 'tariff', 'trade war', 'sanction',
-                       'geopolit', 'military', 'conflict', 'treaty', 'trade deal',
-                       'regulation', 'antitrust', 'investigation']
-        if any(kw in title_lower for kw in geo_keywords):
-            return 'Geopolitical'
+        matched = {category for category, _ in _match_keywords(self._category_automaton, title.lower())}
+        for category in self.CATEGORY_KEYWORDS:
+            if category in matched:
+                return category
 
         return 'General Market'
 
@@ -666,21 +861,16 @@ class MarketData:
         endpoint = screener_endpoints.get(screener_type, 'most_actives')
 
         try:
-            import requests
-            url = "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved"
             params = {
                 'formatted': 'false',
                 'scrIds': endpoint,
                 'count': limit
             }
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
 
-            response = requests.get(url, params=params, headers=headers, timeout=5)
+            async with self._get_http_session().get(self.SCREENER_URL, params=params) as response:
+                data = await response.json(content_type=None) if response.status == 200 else None
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 tickers = []
 
                 if 'finance' in data and 'result' in data['finance']:
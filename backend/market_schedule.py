@@ -1,6 +1,17 @@
-import pandas_market_calendars as mcal
+import logging
+from time import time_ns
+from typing import Optional, Tuple
+
+import numpy as np
 from datetime import datetime, time, timedelta
-import pytz
+from zoneinfo import ZoneInfo
+
+from . import nyse_calendar
+
+logger = logging.getLogger(__name__)
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_HOUR = 3600 * NS_PER_SECOND
 
 
 class MarketSchedule:
@@ -16,13 +27,59 @@ class MarketSchedule:
         Args:
             timezone: Timezone string (default: America/New_York)
         """
-        self.tz = pytz.timezone(timezone)
-        self.nyse = mcal.get_calendar('NYSE')
+        self.tz = ZoneInfo(timezone)
 
         # Market hours in Eastern Time
         self.market_open_time = time(9, 30)  # 9:30 AM
         self.market_close_time = time(16, 0)  # 4:00 PM
 
+        # Sessions for the current and next year as parallel sorted arrays:
+        # session dates, and open/close instants in UTC epoch nanoseconds
+        self._schedule_year = None
+        self._year_end_ns = 0  # Start of the next year in self.tz: reload the schedule from then on
+        self._days = np.empty(0, dtype='datetime64[D]')
+        self._opens_ns = np.empty(0, dtype=np.int64)
+        self._closes_ns = np.empty(0, dtype=np.int64)
+
+        # Instants new trades may start each session (opens shifted by the first-hour
+        # block), rebuilt whenever the block setting or the schedule changes
+        self._effective_opens_ns = self._opens_ns
+        self._effective_opens_blocked: Optional[bool] = None
+
+        self._load_schedule(datetime.now(self.tz).year)
+
+    def _load_schedule(self, year: int):
+        """Load NYSE sessions for `year` and the following year"""
+        sessions = list(nyse_calendar.sessions(datetime(year, 1, 1).date(), datetime(year + 1, 12, 31).date()))
+        self._days = np.array([day for day, _, _ in sessions], dtype='datetime64[D]')
+        self._opens_ns = np.array([self._to_ns(day, open_) for day, open_, _ in sessions], dtype=np.int64)
+        self._closes_ns = np.array([self._to_ns(day, close) for day, _, close in sessions], dtype=np.int64)
+        self._schedule_year = year
+        self._year_end_ns = int(datetime(year + 1, 1, 1, tzinfo=self.tz).timestamp()) * NS_PER_SECOND
+        self._effective_opens_blocked = None
+
+    def _now_ns(self) -> int:
+        """Current time as UTC epoch nanoseconds (reloads the schedule on year rollover)"""
+        now_ns = time_ns()
+        if now_ns >= self._year_end_ns:
+            self._load_schedule(datetime.now(self.tz).year)
+        return now_ns
+
+    def _to_ns(self, day, wall_time: time) -> int:
+        """Eastern wall-clock time on `day` to UTC epoch nanoseconds"""
+        return int(datetime.combine(day, wall_time, tzinfo=self.tz).timestamp()) * NS_PER_SECOND
+
+    def _from_ns(self, ns: int) -> datetime:
+        """Epoch nanoseconds to a datetime in self.tz"""
+        return datetime.fromtimestamp(int(ns) // 1000 / 1_000_000, tz=self.tz)
+
+    def _effective_opens(self, block_first_hour: bool) -> np.ndarray:
+        """Per-session trading start instants (the open, or an hour later if the first hour is blocked)"""
+        if block_first_hour != self._effective_opens_blocked:
+            self._effective_opens_ns = self._opens_ns + NS_PER_HOUR if block_first_hour else self._opens_ns
+            self._effective_opens_blocked = block_first_hour
+        return self._effective_opens_ns
+
     def is_market_open_for_new_trades(self) -> bool:
         """
         Check if the market is currently open for new trades.
@@ -33,40 +90,41 @@ class MarketSchedule:
             If settings.SKIP_MARKET_SCHEDULE_CHECK is True, always returns True (for testing).
             If settings.BLOCK_FIRST_HOUR_TRADING is True, blocks trades during 9:30-10:30 AM ET.
         """
+        return self.get_trading_window()[0]
+
+    def get_trading_window(self) -> Tuple[bool, Optional[int]]:
+        """
+        Check if the market is open for new trades, and until when that answer holds.
+
+        Returns:
+            (open, next_change_ns): same answer as is_market_open_for_new_trades(), and the
+            UTC epoch nanoseconds at which it next flips (None while the schedule check is skipped)
+        """
         # Import here to avoid circular dependency and to get latest value
         from backend.config import settings
 
         # If skip flag is set, always return True (for testing outside market hours)
         if settings.SKIP_MARKET_SCHEDULE_CHECK:
-            return True
-
-        now = datetime.now(self.tz)
+            return True, None
 
-        # Get today's schedule
-        schedule = self.nyse.schedule(
-            start_date=now.date(),
-            end_date=now.date()
-        )
+        now_ns = self._now_ns()
 
-        # If schedule is empty, market is not open today (weekend or holiday)
-        if schedule.empty:
-            return False
+        # If first hour trading is blocked, trading starts an hour after the open (10:30 AM ET)
+        starts_ns = self._effective_opens(settings.BLOCK_FIRST_HOUR_TRADING)
 
-        # Get market open and close times for today
-        market_open = schedule.iloc[0]['market_open'].tz_convert(self.tz)
-        market_close = schedule.iloc[0]['market_close'].tz_convert(self.tz)
+        # Latest session that opened at or before now (none: before the first session)
+        i = int(np.searchsorted(self._opens_ns, now_ns, side='right')) - 1
 
-        # Check if current time is between market open and close
-        if not (market_open <= now <= market_close):
-            return False
+        # Open if now is between that session's trading start and close
+        if i >= 0 and starts_ns[i] <= now_ns <= self._closes_ns[i]:
+            return True, int(self._closes_ns[i]) + 1
+        if i >= 0 and now_ns < starts_ns[i]:
+            return False, int(starts_ns[i])
 
-        # If first hour trading is blocked, check if we're in the first hour (9:30-10:30 AM ET)
-        if settings.BLOCK_FIRST_HOUR_TRADING:
-            first_hour_end = market_open + timedelta(hours=1)
-            if now < first_hour_end:
-                return False
-
-        return True
+        # Closed until the next session's trading start
+        if i + 1 < len(starts_ns):
+            return False, int(starts_ns[i + 1])
+        return False, now_ns + NS_PER_HOUR  # Past the precomputed years - look again later
 
     def get_next_market_open(self) -> datetime:
         """
@@ -75,26 +133,15 @@ class MarketSchedule:
         Returns:
             Datetime object representing the next market open time in Eastern Time.
         """
-        now = datetime.now(self.tz)
-
-        # Get schedule for next 10 days to find next trading day
-        schedule = self.nyse.schedule(
-            start_date=now.date(),
-            end_date=(now + timedelta(days=10)).date()
-        )
-
-        if schedule.empty:
-            # Shouldn't happen, but return a fallback
-            return now + timedelta(days=1)
+        now_ns = self._now_ns()
 
-        # Find the next market open
-        for idx, row in schedule.iterrows():
-            market_open = row['market_open'].tz_convert(self.tz)
-            if market_open > now:
-                return market_open
+        # First session opening strictly after now
+        i = int(np.searchsorted(self._opens_ns, now_ns, side='right'))
+        if i >= len(self._opens_ns):
+            # Shouldn't happen (the schedule covers next year), but return a fallback
+            return self._from_ns(now_ns) + timedelta(days=1)
 
-        # If we get here, return first item in schedule
-        return schedule.iloc[0]['market_open'].tz_convert(self.tz)
+        return self._from_ns(self._opens_ns[i])
 
     def get_time_until_market_open(self) -> str:
         """
@@ -132,14 +179,15 @@ class MarketSchedule:
             True if the date is a trading day, False otherwise
         """
         if date is None:
-            date = datetime.now(self.tz).date()
+            date = self._from_ns(self._now_ns()).date()
 
-        schedule = self.nyse.schedule(
-            start_date=date,
-            end_date=date
-        )
+        day = np.datetime64(date, 'D')
+        if not len(self._days) or not (self._days[0] <= day <= self._days[-1]):
+            # Outside the precomputed years - ask the calendar directly
+            return nyse_calendar.is_trading_day(date)
 
-        return not schedule.empty
+        i = int(np.searchsorted(self._days, day))
+        return bool(self._days[i] == day)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""
+NYSE trading calendar
+Holiday and early-close rules for the regular NYSE calendar (2022 onward, when
+Juneteenth became a market holiday), replacing pandas_market_calendars for the
+one exchange we trade on.
+"""
+from datetime import date, time, timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, Optional, Tuple
+
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+# One-off closures announced by the exchange (e.g. national days of mourning)
+ADHOC_CLOSURES: FrozenSet[date] = frozenset({
+    date(2025, 1, 9),  # President Carter's national day of mourning
+})
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th `weekday` (Mon=0) of the month; n=-1 for the last one"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=16)
+def holidays(year: int) -> FrozenSet[date]:
+    """Full-day market holidays in `year`"""
+    days = {
+        _nth_weekday(year, 1, 0, 3),                # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),                # Washington's Birthday
+        _easter(year) - timedelta(days=2),          # Good Friday
+        _nth_weekday(year, 5, 0, -1),               # Memorial Day
+        _observed(date(year, 6, 19)),               # Juneteenth
+        _observed(date(year, 7, 4)),                # Independence Day
+        _nth_weekday(year, 9, 0, 1),                # Labor Day
+        _nth_weekday(year, 11, 3, 4),               # Thanksgiving
+        _observed(date(year, 12, 25)),              # Christmas
+    }
+
+    # New Year's Day on a Saturday is not observed on the preceding Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+
+    days.update(d for d in ADHOC_CLOSURES if d.year == year)
+    return frozenset(days)
+
+
+@lru_cache(maxsize=16)
+def early_closes(year: int) -> Dict[date, time]:
+    """Sessions closing at 1:00 PM ET in `year`"""
+    days = [_nth_weekday(year, 11, 3, 4) + timedelta(days=1)]  # Day after Thanksgiving
+
+    # Eves of Independence Day and Christmas, when they fall Monday-Thursday
+    for eve in (date(year, 7, 3), date(year, 12, 24)):
+        if eve.weekday() < 4:
+            days.append(eve)
+
+    return {d: EARLY_CLOSE for d in days}
+
+
+def session(day: date) -> Optional[Tuple[time, time]]:
+    """(open, close) Eastern wall-clock times for `day`, or None if the market is closed"""
+    if day.weekday() >= 5 or day in holidays(day.year):
+        return None
+    return REGULAR_OPEN, early_closes(day.year).get(day, REGULAR_CLOSE)
+
+
+def is_trading_day(day: date) -> bool:
+    """True if the NYSE holds a session on `day`"""
+    return session(day) is not None
+
+
+def sessions(start: date, end: date) -> Iterator[Tuple[date, time, time]]:
+    """(day, open, close) for every session from `start` to `end` inclusive"""
+    day = start
+    while day <= end:
+        hours = session(day)
+        if hours:
+            yield day, hours[0], hours[1]
+        day += timedelta(days=1)
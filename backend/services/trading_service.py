@@ -11,7 +11,7 @@ This service is completely decoupled from FastAPI and can be used in:
 ARCHITECTURE:
 - Singleton pattern ensures one global instance
 - Background monitoring task runs continuously without blocking
-- All blocking Robinhood API calls use asyncio.to_thread() to avoid event loop blocking
+- All blocking Robinhood API calls run on a dedicated thread pool to avoid event loop blocking
 
 POSITION MONITORING:
 - Started automatically on Robinhood login
@@ -22,13 +22,19 @@ POSITION MONITORING:
 CONCURRENCY:
 - Supports unlimited concurrent users and positions
 - Monitoring runs independently in background task
-- Thread pool used only for unavoidable blocking Robinhood API calls
+- Dedicated thread pool used only for unavoidable blocking Robinhood API calls
+  (separate from the default executor shared by other to_thread() callers)
 """
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Optional, Dict
 from datetime import datetime
 
+import numpy as np
+
 from ..config import settings
 from ..cache import cache
 from ..database import db
@@ -39,6 +45,16 @@ from ..auth import auth_manager
 
 logger = logging.getLogger(__name__)
 
+# Saved riskManagement settings applied at startup:
+# (settings key, config attribute, converter, display format)
+_SETTINGS_MAP = (
+    ("default_take_profit", "DEFAULT_TAKE_PROFIT", lambda v: v / 100.0, "{:.2%}"),
+    ("default_stop_loss", "DEFAULT_STOP_LOSS", lambda v: v / 100.0, "{:.2%}"),
+    ("max_position_size", "MAX_POSITION_SIZE", float, "${:,.2f}"),
+    ("skip_market_schedule_check", "SKIP_MARKET_SCHEDULE_CHECK", bool, "{}"),
+    ("block_first_hour_trading", "BLOCK_FIRST_HOUR_TRADING", bool, "{}"),
+)
+
 
 class TradingService:
     """
@@ -48,6 +64,12 @@ class TradingService:
     """
     _instance = None
 
+    # How long a Robinhood session probe result is trusted by the monitor loop
+    LOGIN_CHECK_TTL_SECONDS = 30
+
+    # Threads reserved for blocking Robinhood calls (enough for concurrent TP/SL sells)
+    ROBINHOOD_WORKERS = 4
+
     @classmethod
     def get_instance(cls):
         """Get or create singleton instance"""
@@ -59,12 +81,22 @@ class TradingService:
         logger.info("🚀 Initializing Trading Service v2...")
         self.md = MarketData()
         self.trader = Trader()
-        self.market_schedule = MarketSchedule()
+        self._rh_executor = ThreadPoolExecutor(max_workers=self.ROBINHOOD_WORKERS, thread_name_prefix="robinhood")
         self.login_state = {"status": "idle", "message": ""}
 
         # Monitoring state
         self.monitoring_task: Optional[asyncio.Task] = None
         self.position_settings: Dict[str, Dict] = {}  # {option_id: {tp, sl}}
+        self._wake_event = asyncio.Event()  # Set to run the next monitor check right away
+
+        # Last Robinhood session probe (see _is_logged_in_cached)
+        self._login_cached_at: float = 0.0
+        self._login_cached_value: bool = False
+
+    @cached_property
+    def market_schedule(self) -> MarketSchedule:
+        """NYSE schedule, built on first use rather than at import"""
+        return MarketSchedule()
 
     async def start(self):
         """
@@ -79,8 +111,13 @@ class TradingService:
         auth_manager.db = db
         logger.info("✅ Database injected into AuthManager for session persistence")
 
-        # Load saved settings from database and apply to runtime config
-        await self._load_settings_from_database()
+        # Load saved settings from database and apply to runtime config.
+        # Meanwhile, build the NYSE schedule (current and next year) in a worker thread
+        # so the first monitor tick and market-hours request don't pay for it.
+        await asyncio.gather(
+            self._load_settings_from_database(),
+            asyncio.to_thread(lambda: self.market_schedule)
+        )
 
         # NOTE: Auto-login disabled - using web-based authentication instead
         # Users now login through the web interface
@@ -105,32 +142,17 @@ class TradingService:
             settings_data = await db.get_settings('default_user')
 
             if settings_data:
-                logger.info("Loading saved settings from database (default_user)...")
-
                 # Update runtime settings with saved values
                 risk = settings_data.get('riskManagement', {})
 
-                if 'default_take_profit' in risk:
-                    settings.DEFAULT_TAKE_PROFIT = risk['default_take_profit'] / 100.0
-                    logger.info(f"  DEFAULT_TAKE_PROFIT = {settings.DEFAULT_TAKE_PROFIT:.2%}")
+                loaded = {}
+                for key, attr, conv, fmt in _SETTINGS_MAP:
+                    if key in risk:
+                        value = conv(risk[key])
+                        setattr(settings, attr, value)
+                        loaded[attr] = fmt.format(value)
 
-                if 'default_stop_loss' in risk:
-                    settings.DEFAULT_STOP_LOSS = risk['default_stop_loss'] / 100.0
-                    logger.info(f"  DEFAULT_STOP_LOSS = {settings.DEFAULT_STOP_LOSS:.2%}")
-
-                if 'max_position_size' in risk:
-                    settings.MAX_POSITION_SIZE = float(risk['max_position_size'])
-                    logger.info(f"  MAX_POSITION_SIZE = ${settings.MAX_POSITION_SIZE:,.2f}")
-
-                if 'skip_market_schedule_check' in risk:
-                    settings.SKIP_MARKET_SCHEDULE_CHECK = bool(risk['skip_market_schedule_check'])
-                    logger.info(f"  SKIP_MARKET_SCHEDULE_CHECK = {settings.SKIP_MARKET_SCHEDULE_CHECK}")
-
-                if 'block_first_hour_trading' in risk:
-                    settings.BLOCK_FIRST_HOUR_TRADING = bool(risk['block_first_hour_trading'])
-                    logger.info(f"  BLOCK_FIRST_HOUR_TRADING = {settings.BLOCK_FIRST_HOUR_TRADING}")
-
-                logger.info("✅ Settings loaded successfully from database")
+                logger.info("✅ Loaded saved settings from database (default_user): %s", loaded)
             else:
                 logger.info("No saved settings found - using defaults from config.py")
 
@@ -146,18 +168,52 @@ class TradingService:
         """
         if self.monitoring_task:
             self.monitoring_task.cancel()
+        await self.md.aclose()
+        self._rh_executor.shutdown(wait=False)
         await cache.disconnect()
         await db.disconnect()
 
+    async def _run_robinhood(self, fn, *args):
+        """Run a blocking Robinhood call on the dedicated Robinhood thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._rh_executor, fn, *args)
+
+    async def _is_logged_in_cached(self) -> bool:
+        """Robinhood session check, re-probed at most every LOGIN_CHECK_TTL_SECONDS"""
+        if time.monotonic() - self._login_cached_at < self.LOGIN_CHECK_TTL_SECONDS:
+            return self._login_cached_value
+
+        # The probe is a blocking profile request - keep it off the event loop
+        self._login_cached_value = await self._run_robinhood(self.trader.is_logged_in)
+        self._login_cached_at = time.monotonic()
+        return self._login_cached_value
+
+    def invalidate_login_cache(self):
+        """Force the next session check to probe Robinhood (call on login/logout)"""
+        self._login_cached_at = 0.0
+        self.trader.invalidate_login_cache()
+
+    def wake_monitor(self):
+        """Run the next position check now instead of after the current interval (e.g. new position, TP/SL change)"""
+        self._wake_event.set()
+
+    async def _wait_for_next_check(self, timeout: float):
+        """Sleep up to `timeout` seconds, returning early if wake_monitor() is called"""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
     async def _monitor_positions_loop(self):
         """
         Async position monitoring loop - non-blocking background task.
 
         Runs continuously checking all open positions with dynamic interval:
         - During market hours: POSITION_CHECK_INTERVAL seconds (default 30s)
-        - After market close: 1 hour (3600s) to reduce unnecessary API calls
+        - After market close: 1 hour (3600s) to reduce unnecessary API calls,
+          shortened so the loop wakes up right at the next open
 
-        Uses asyncio.to_thread() to avoid blocking the event loop when calling
+        Uses the Robinhood thread pool to avoid blocking the event loop when calling
         synchronous Robinhood API methods.
 
         This is the ONLY position monitoring mechanism - the blocking monitor_position()
@@ -166,15 +222,24 @@ class TradingService:
         logger.info("🔍 Starting async position monitoring loop")
         last_market_status = None  # Track to log only on status change
 
+        # Market state only changes at session boundaries: keep it until the next one
+        # (or until the schedule-related settings change)
+        market_open = False
+        next_boundary_ns: Optional[int] = None
+        schedule_flags = None
+
         while True:
             try:
-                if not self.trader.is_logged_in():
+                if not await self._is_logged_in_cached():
                     logger.debug("Not logged in, waiting 60s before retry")
-                    await asyncio.sleep(60)
+                    await self._wait_for_next_check(60)
                     continue
 
                 # Check if market is open for dynamic interval adjustment
-                market_open = self.market_schedule.is_market_open_for_new_trades()
+                flags = (settings.SKIP_MARKET_SCHEDULE_CHECK, settings.BLOCK_FIRST_HOUR_TRADING)
+                if flags != schedule_flags or (next_boundary_ns is not None and time.time_ns() >= next_boundary_ns):
+                    market_open, next_boundary_ns = self.market_schedule.get_trading_window()
+                    schedule_flags = flags
 
                 # Log market status changes
                 if market_open != last_market_status:
@@ -185,25 +250,30 @@ class TradingService:
                     last_market_status = market_open
 
                 # Determine check interval based on market status
-                check_interval = settings.POSITION_CHECK_INTERVAL if market_open else 3600  # 1 hour when closed
+                if market_open:
+                    check_interval = settings.POSITION_CHECK_INTERVAL
+                elif next_boundary_ns is not None:
+                    # Closed: at most 1 hour, waking up right at the next open
+                    check_interval = min(3600, max(1, (next_boundary_ns - time.time_ns()) / 1e9))
+                else:
+                    check_interval = 3600  # 1 hour when closed
 
                 # Get positions from Robinhood (offload to thread pool to avoid blocking)
-                # asyncio.to_thread() is cleaner than run_in_executor for simple blocking calls
-                positions = await asyncio.to_thread(
-                    self.trader.get_all_open_option_positions
+                positions = await self._run_robinhood(self.trader.get_all_open_option_positions)
+
+                # Get TP/SL settings for all positions in one query (any user - background monitoring)
+                db_settings = await db.get_positions_settings(
+                    [pos['option_id'] for pos in positions if pos.get('option_id')]
                 )
 
-                # Check each position for TP/SL
-                positions_checked = 0
+                # Collect P&L and TP/SL thresholds for each position with an exit rule
+                monitored = []
                 for pos in positions:
                     option_id = pos.get('option_id')
                     if not option_id:
                         continue
 
-                    positions_checked += 1
-
-                    # Get TP/SL settings from DB (use any_user version for background monitoring)
-                    db_pos = await db.get_position_any_user(option_id)
+                    db_pos = db_settings.get(option_id)
                     if not db_pos:
                         # Load from memory or use defaults
                         settings_dict = self.position_settings.get(option_id, {
@@ -218,33 +288,60 @@ class TradingService:
                         }
                         user_id = db_pos.get('user_id')
 
-                    take_profit = settings_dict.get('take_profit')
-                    stop_loss = settings_dict.get('stop_loss')
+                    take_profit = settings_dict.get('take_profit') or 0.0
+                    stop_loss = settings_dict.get('stop_loss') or 0.0
 
-                    if not take_profit and not stop_loss:
+                    # Positions without any exit rule never need evaluating
+                    if take_profit <= 0 and stop_loss <= 0:
                         continue
 
-                    # Check P&L
-                    pnl_percent = pos.get('pnl_percent', 0) / 100.0
-
-                    # Take Profit hit
-                    if take_profit and pnl_percent >= take_profit:
-                        logger.info(f"🎯 TP hit: {pos['ticker']} at {pnl_percent*100:.2f}%")
-                        await self._sell_position(pos, "Take Profit", user_id)
-                        continue
-
-                    # Stop Loss hit
-                    if stop_loss and pnl_percent <= -stop_loss:
-                        logger.info(f"🛑 SL hit: {pos['ticker']} at {pnl_percent*100:.2f}%")
-                        await self._sell_position(pos, "Stop Loss", user_id)
-                        continue
-
-                # Log monitoring cycle completion
-                if positions_checked > 0:
-                    logger.debug(f"✓ Checked {positions_checked} positions, no exits triggered")
-
-                # Sleep before next check with dynamic interval (non-blocking!)
-                await asyncio.sleep(check_interval)
+                    monitored.append((pos, user_id, take_profit, stop_loss))
+
+                positions_checked = len(monitored)
+
+                # Evaluate TP/SL for all candidates in one vectorized pass (skipped when there are none)
+                pending_sells = []
+                if monitored:
+                    pnl = np.fromiter(
+                        (pos.get('pnl_percent', 0) / 100.0 for pos, _, _, _ in monitored),
+                        dtype=np.float64, count=positions_checked
+                    )
+                    tp = np.fromiter((m[2] for m in monitored), dtype=np.float64, count=positions_checked)
+                    sl = np.fromiter((m[3] for m in monitored), dtype=np.float64, count=positions_checked)
+
+                    tp_hits = (tp > 0) & (pnl >= tp)
+                    sl_hits = (sl > 0) & (pnl <= -sl)
+
+                    # Only triggered positions reach Python; Take Profit wins if both hit
+                    for i in np.flatnonzero(tp_hits | sl_hits):
+                        pos, user_id, _, _ = monitored[i]
+                        reason = "Take Profit" if tp_hits[i] else "Stop Loss"
+                        pending_sells.append((pos, reason, user_id, round(float(pnl[i]) * 100, 2)))
+
+                # Log monitoring cycle completion: one record per cycle, structured fields in `extra`
+                if pending_sells:
+                    triggers = [
+                        {"ticker": pos['ticker'], "option_id": pos['option_id'], "reason": reason, "pnl_percent": pnl_pct}
+                        for pos, reason, _, pnl_pct in pending_sells
+                    ]
+                    logger.info(
+                        "🎯 Checked %d positions, exits triggered: %s",
+                        positions_checked,
+                        ", ".join(f"{t['ticker']} {t['reason']} at {t['pnl_percent']:.2f}%" for t in triggers),
+                        extra={"checked": positions_checked, "triggers": triggers, "market_open": market_open}
+                    )
+
+                    # Sells are independent network calls: run them concurrently
+                    await asyncio.gather(
+                        *(self._sell_position(pos, reason, user_id) for pos, reason, user_id, _ in pending_sells),
+                        return_exceptions=True
+                    )
+                elif positions_checked > 0:
+                    logger.debug("✓ Checked %d positions, no exits triggered", positions_checked)
+
+                # Sleep before next check with dynamic interval (non-blocking!),
+                # or until wake_monitor() is called
+                await self._wait_for_next_check(check_interval)
 
             except asyncio.CancelledError:
                 logger.info("Monitoring cancelled")
@@ -257,15 +354,12 @@ class TradingService:
         """
         Async wrapper to sell a position without blocking the event loop.
 
-        Uses asyncio.to_thread() to offload the blocking Robinhood API call
-        to a thread pool worker, allowing other requests to continue processing.
+        Offloads the blocking Robinhood API call to the Robinhood thread pool,
+        allowing other requests to continue processing.
         """
         try:
-            ticker = position['ticker']
             option_id = position['option_id']
 
-            logger.info(f"💰 Selling {ticker} due to {reason}")
-
             trade_details = {
                 'option_id': option_id,
                 'quantity': position['contracts'],
@@ -273,10 +367,7 @@ class TradingService:
             }
 
             # Run blocking sell in thread pool (non-blocking)
-            await asyncio.to_thread(
-                self.trader.sell_option,
-                trade_details
-            )
+            await self._run_robinhood(self.trader.sell_option, trade_details)
 
             # Update database (only if we have user_id from DB position)
             if user_id:
@@ -294,7 +385,10 @@ class TradingService:
                 del self.position_settings[option_id]
 
         except Exception as e:
-            logger.error(f"Error selling position: {e}")
+            logger.error(f"Error selling {position.get('ticker')} ({reason}): {e}")
+            # An expired session must not keep reporting as logged in
+            if '401' in str(e) or 'unauthorized' in str(e).lower():
+                self.invalidate_login_cache()
 
 
 # Global singleton instance
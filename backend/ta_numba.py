@@ -0,0 +1,103 @@
+"""
+Numba-compiled ATR and ADX kernels
+Fallback for the slowest `ta` indicators when TA-Lib is not installed.
+Each kernel reproduces the `ta` implementation step by step (including its
+zero-filled warm-up rows) so the two paths produce the same columns.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range; the first row has no previous close and uses high - low"""
+    n = len(close)
+    tr = np.empty(n)
+    if n == 0:
+        return tr
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        tr[i] = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    return tr
+
+
+@njit(cache=True)
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    """Average True Range with Wilder smoothing (same as ta.volatility.AverageTrueRange)"""
+    n = len(close)
+    if n < window:
+        raise ValueError("Not enough rows for ATR")
+
+    tr = true_range(high, low, close)
+    out = np.zeros(n)
+    out[window - 1] = tr[:window].mean()
+    for i in range(window, n):
+        out[i] = (out[i - 1] * (window - 1) + tr[i]) / window
+    return out
+
+
+@njit(cache=True)
+def _wilder_sums(values: np.ndarray, window: int, length: int) -> np.ndarray:
+    """Running Wilder sums as computed by ta's ADXIndicator (values[0] is the undefined first row)"""
+    sums = np.zeros(length)
+    sums[0] = values[1:window + 1].sum()
+    for i in range(1, length - 1):
+        sums[i] = sums[i - 1] - sums[i - 1] / window + values[window + i]
+    return sums
+
+
+@njit(cache=True)
+def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int):
+    """
+    Average Directional Index with +DI and -DI (same as ta.trend.ADXIndicator).
+
+    Returns:
+        (adx, adx_pos, adx_neg) arrays aligned with the input rows
+    """
+    n = len(close)
+    if n < 2 * window:
+        raise ValueError("Not enough rows for ADX")
+
+    # Per-row directional movement and true range (row 0 is undefined and skipped)
+    tr = np.zeros(n)
+    pos = np.zeros(n)
+    neg = np.zeros(n)
+    for i in range(1, n):
+        tr[i] = max(high[i], close[i - 1]) - min(low[i], close[i - 1])
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        if up > down and up > 0:
+            pos[i] = up
+        if down > up and down > 0:
+            neg[i] = down
+
+    length = n - (window - 1)
+    trs = _wilder_sums(tr, window, length)
+    dip = _wilder_sums(pos, window, length)
+    din = _wilder_sums(neg, window, length)
+
+    # Directional index over the smoothed series
+    dx = np.zeros(length)
+    for i in range(length):
+        if trs[i] != 0:
+            di_pos = 100 * (dip[i] / trs[i])
+            di_neg = 100 * (din[i] / trs[i])
+            if di_pos + di_neg != 0:
+                dx[i] = 100 * abs((di_pos - di_neg) / (di_pos + di_neg))
+
+    adx_out = np.zeros(n)
+    smoothed = dx[:window].mean()
+    adx_out[window - 1 + window] = smoothed
+    for i in range(window + 1, length):
+        smoothed = (smoothed * (window - 1) + dx[i - 1]) / window
+        adx_out[window - 1 + i] = smoothed
+
+    # +DI / -DI, shifted by one row exactly as ta reports them
+    adx_pos = np.zeros(n)
+    adx_neg = np.zeros(n)
+    for i in range(1, length - 1):
+        if trs[i] != 0:
+            adx_pos[i + window] = 100 * (dip[i] / trs[i])
+            adx_neg[i + window] = 100 * (din[i] / trs[i])
+
+    return adx_out, adx_pos, adx_neg
@@ -89,6 +89,14 @@ async def test_news(orchestrator: DataSourceOrchestrator, ticker: str):
         return False
 
 
+async def test_ticker(orchestrator: DataSourceOrchestrator, ticker: str):
+    """Test historical data, quote and news for one ticker"""
+    historical = await test_historical_data(orchestrator, ticker)
+    quote = await test_quote(orchestrator, ticker)
+    news = await test_news(orchestrator, ticker)
+    return historical, quote, news
+
+
 async def test_circuit_breaker():
     """Test circuit breaker pattern by simulating failures"""
     logger.info(f"\n{'='*60}")
@@ -175,26 +183,18 @@ async def run_comprehensive_test():
         'news': []
     }
 
-    # Test each ticker
-    for ticker in test_tickers:
-        # Test historical data
-        success = await test_historical_data(orchestrator, ticker)
-        results['historical'].append((ticker, success))
-
-        # Small delay between tests
-        await asyncio.sleep(1)
-
-        # Test quote
-        success = await test_quote(orchestrator, ticker)
-        results['quote'].append((ticker, success))
-
-        await asyncio.sleep(1)
-
-        # Test news
-        success = await test_news(orchestrator, ticker)
-        results['news'].append((ticker, success))
+    # Test tickers concurrently (each ticker runs its three tests in sequence)
+    ticker_results = await asyncio.gather(
+        *[test_ticker(orchestrator, ticker) for ticker in test_tickers],
+        return_exceptions=True
+    )
 
-        await asyncio.sleep(1)
+    for ticker, outcome in zip(test_tickers, ticker_results):
+        if isinstance(outcome, Exception):
+            logger.error(f"✗ Error testing {ticker}: {outcome}")
+            outcome = (False, False, False)
+        for data_type, success in zip(results, outcome):
+            results[data_type].append((ticker, success))
 
     # Display final status
     await display_status(orchestrator)
@@ -2,26 +2,168 @@ import robin_stocks.robinhood as r
 import math
 import datetime
 import time
+import bisect
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Option instruments never change once listed; chain expirations change at most daily
+_instrument_cache = TTLCache(maxsize=4096, ttl=86400)
+_chains_cache = TTLCache(maxsize=256, ttl=3600)
+# Market data is only reused within a burst (e.g. a monitor tick followed by its sells)
+_market_data_cache = TTLCache(maxsize=1024, ttl=5)
+# Stock quotes are only shared by back-to-back option searches for the same ticker
+_price_cache = TTLCache(maxsize=256, ttl=1)
+_cache_lock = threading.Lock()  # Lookups run on several threads
+
+
+def _cached_lookup(cache, key, fetch):
+    """Return cache[key], calling fetch(key) on a miss (failed/empty results are not cached)"""
+    with _cache_lock:
+        value = cache.get(key)
+    if value is None:
+        value = fetch(key)
+        if value:
+            with _cache_lock:
+                cache[key] = value
+    return value
+
+
+def _get_instrument(option_id):
+    """Option instrument details (cached)"""
+    return _cached_lookup(_instrument_cache, option_id, r.get_option_instrument_data_by_id)
+
+
+def _fetch_chains(ticker):
+    """Option chain info with expiration dates sorted ascending"""
+    chains = r.get_chains(ticker)
+    if chains and chains.get('expiration_dates'):
+        chains['expiration_dates'].sort()
+    return chains
+
+
+def _get_chains(ticker):
+    """Option chain info including expiration dates (cached)"""
+    return _cached_lookup(_chains_cache, ticker, _fetch_chains)
+
+
+def _first_expiration_after(expirations, cutoff):
+    """First ISO expiration date after `cutoff` in a sorted list, else the last one"""
+    idx = bisect.bisect_right(expirations, cutoff)
+    return expirations[idx] if idx < len(expirations) else expirations[-1]
+
+
+def _get_latest_price(ticker):
+    """Latest stock price as a float (cached for a second)"""
+    return _cached_lookup(_price_cache, ticker, lambda symbol: float(r.get_latest_price(symbol)[0]))
+
 
 class Trader:
+    # Worker threads for concurrent Robinhood lookups (kept modest for rate limits)
+    LOOKUP_WORKERS = 8
+    # Option instruments per bulk instrument/market data request (all IDs go in the query string)
+    BULK_BATCH_SIZE = 50
+    # How long a session check result is reused before asking Robinhood again
+    LOGIN_CHECK_TTL_SECONDS = 30
+    # Kept-alive connections per host on robin_stocks' shared session; covers the lookup pool
+    # plus TradingService's Robinhood threads so concurrent calls don't open throwaway sockets
+    HTTP_POOL_SIZE = 16
+
     def __init__(self):
         self.logged_in = False
+        self._lookup_pool = ThreadPoolExecutor(max_workers=self.LOOKUP_WORKERS, thread_name_prefix="rh-lookup")
+        self._login_cache = (0.0, False)  # (time.monotonic() of last check, result)
+
+        # robin_stocks sends every request through one global requests.Session (already keep-alive);
+        # size its connection pool for our concurrent callers
+        r.helper.SESSION.mount("https://", HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE))
 
     def is_logged_in(self):
         """
         Check if there's an active Robinhood session.
         Returns True if logged in, False otherwise.
+        The result is reused for LOGIN_CHECK_TTL_SECONDS.
         """
+        checked_at, logged_in = self._login_cache
+        if time.monotonic() - checked_at < self.LOGIN_CHECK_TTL_SECONDS:
+            return logged_in
+
         try:
             # Try to load account profile to verify session is active
             profile = r.profiles.load_account_profile()
-            return profile is not None and isinstance(profile, dict)
+            logged_in = profile is not None and isinstance(profile, dict)
         except Exception:
-            return False
+            logged_in = False
+
+        self._login_cache = (time.monotonic(), logged_in)
+        return logged_in
+
+    def invalidate_login_cache(self):
+        """Make the next is_logged_in() ask Robinhood again (after login/logout or an auth error)"""
+        self._login_cache = (0.0, False)
+
+    def _check_auth_error(self, error):
+        """Invalidate the cached session check if `error` looks like an expired session"""
+        if '401' in str(error) or 'unauthorized' in str(error).lower():
+            self.invalidate_login_cache()
+
+    @classmethod
+    def _get_instruments(cls, option_ids):
+        """
+        Instrument details for several options with one request per batch
+        (instead of one lookup per ID), keyed by option ID. Cached like _get_instrument.
+        """
+        with _cache_lock:
+            instruments = {option_id: _instrument_cache[option_id]
+                           for option_id in option_ids if option_id in _instrument_cache}
+        missing = [option_id for option_id in option_ids if option_id not in instruments]
+
+        for i in range(0, len(missing), cls.BULK_BATCH_SIZE):
+            batch = missing[i:i + cls.BULK_BATCH_SIZE]
+            results = r.helper.request_get(
+                r.urls.option_instruments_url(),
+                'pagination',
+                {'ids': ','.join(batch)}
+            )
+            for instrument in results or []:
+                if instrument:
+                    instruments[instrument['id']] = instrument
+                    with _cache_lock:
+                        _instrument_cache[instrument['id']] = instrument
+        return instruments
+
+    @classmethod
+    def _get_market_data(cls, option_ids):
+        """
+        Market data for several option instruments with one request per batch
+        (instead of one lookup per ID), keyed by option ID. Data fetched in the
+        last few seconds is reused.
+        """
+        with _cache_lock:
+            market_data = {option_id: _market_data_cache[option_id]
+                           for option_id in option_ids if option_id in _market_data_cache}
+        missing = [option_id for option_id in option_ids if option_id not in market_data]
+
+        for i in range(0, len(missing), cls.BULK_BATCH_SIZE):
+            batch = missing[i:i + cls.BULK_BATCH_SIZE]
+            results = r.helper.request_get(
+                r.urls.marketdata_options_url(),
+                'results',
+                {'instruments': ','.join(r.urls.option_instruments_url(option_id) for option_id in batch)}
+            )
+            for data in results or []:
+                if data:
+                    option_id = data.get('instrument_id') or data['instrument'].rstrip('/').rsplit('/', 1)[-1]
+                    market_data[option_id] = data
+                    with _cache_lock:
+                        _market_data_cache[option_id] = data
+        return market_data
 
     @staticmethod
     def round_option_price(price):
@@ -56,96 +198,128 @@ class Trader:
                 logger.info("No open option positions found")
                 return []
 
-            result = []
-
+            # Open positions with an option instrument: (position, quantity, option_id)
+            active = []
             for pos in positions:
                 try:
                     # Extract position details
                     quantity = float(pos.get('quantity', 0))
 
-                    # Skip if quantity is 0 or position is closed
-                    if quantity == 0:
+                    # Skip closed or empty positions
+                    if quantity <= 0:
                         continue
 
-                    # Get average price per contract
-                    price_per_contract = float(pos.get('average_price', 0))
-
                     # Get option instrument URL and ID
                     option_url = pos.get('option')
                     if not option_url:
                         continue
 
                     # Extract option ID from URL
-                    option_id = option_url.split('/')[-2] if option_url else None
+                    option_id = option_url.rsplit('/', 2)[-2]
 
                     if not option_id:
                         continue
 
-                    # Get option instrument details
-                    instrument = r.get_option_instrument_data_by_id(option_id)
+                    active.append((pos, quantity, option_id))
+
+                except Exception as e:
+                    logger.error(f"Error processing position: {e}")
+                    continue
+
+            if not active:
+                logger.info("No open option positions found")
+                return []
+
+            # Fetch instrument details and market data for all positions with two concurrent bulk requests
+            option_ids = [option_id for _, _, option_id in active]
+            market_data_future = self._lookup_pool.submit(self._get_market_data, option_ids)
+            instruments_by_id = self._get_instruments(option_ids)
+            try:
+                market_data_by_id = market_data_future.result()
+            except Exception as e:
+                logger.error(f"Error fetching option market data: {e}")
+                market_data_by_id = {}
+
+            # Parse each position's instrument details and prices
+            result = []
+            quantities, avg_prices, current_prices = [], [], []
 
+            for pos, quantity, option_id in active:
+                try:
+                    instrument = instruments_by_id.get(option_id)
                     if not instrument:
                         continue
 
+                    # Get average price per contract
+                    price_per_contract = float(pos.get('average_price', 0))
+
                     # Extract details
                     ticker = instrument.get('chain_symbol')
                     strike = float(instrument.get('strike_price', 0))
                     expiration = instrument.get('expiration_date')
                     option_type = instrument.get('type')  # 'call' or 'put'
 
-                    # Get current market data
-                    market_data = r.get_option_market_data_by_id(option_id)
-                    if isinstance(market_data, list) and len(market_data) > 0:
-                        market_data = market_data[0]
+                    # Current market data
+                    market_data = market_data_by_id.get(option_id)
 
                     # Current price per contract from market
                     current_price_per_contract = float(market_data.get('adjusted_mark_price', 0)) if market_data else 0
 
-                    # Calculate total entry cost and current value
-                    # Entry: price_per_contract * number_of_contracts
-                    # Current: current_price_per_contract * number_of_contracts
-                    entry_price = price_per_contract * quantity
-                    current_price = current_price_per_contract * quantity * 100  # Each contract represents 100 shares
-
-                    # Calculate P&L
-                    if current_price > 0 and entry_price > 0:
-                        pnl_percent = ((current_price - entry_price) / entry_price) * 100
-                        pnl_dollars = current_price - entry_price
-                    else:
-                        pnl_percent = 0
-                        pnl_dollars = 0
-
                     # Determine decision type
                     decision = 'BUY_CALL' if option_type == 'call' else 'BUY_PUT'
 
-                    # Build position object
-                    position_data = {
+                    # Build position object (prices and P&L filled in below)
+                    result.append({
                         'ticker': ticker,
                         'decision': decision,
-                        'entry_price': entry_price,
-                        'current_price': current_price,
                         'strike': strike,
                         'expiration': expiration,
                         'contracts': int(quantity),
                         'option_id': option_id,
-                        'pnl_percent': pnl_percent,
-                        'pnl_dollars': pnl_dollars,
                         'option_type': option_type,
                         'source': 'robinhood'  # Mark as coming from Robinhood
-                    }
-
-                    result.append(position_data)
-                    logger.debug(f"Found position: {ticker} {strike} {option_type} - {quantity} contracts, Entry: ${entry_price:.2f}, Current: ${current_price:.2f} ({pnl_percent:+.2f}%)")
+                    })
+                    quantities.append(quantity)
+                    avg_prices.append(price_per_contract)
+                    current_prices.append(current_price_per_contract)
 
                 except Exception as e:
                     logger.error(f"Error processing position: {e}")
                     continue
 
+            if result:
+                qty = np.array(quantities)
+
+                # Calculate total entry cost and current value for all positions at once
+                # Entry: price_per_contract * number_of_contracts
+                # Current: current_price_per_contract * number_of_contracts
+                entry = np.array(avg_prices) * qty
+                current = np.array(current_prices) * qty * 100  # Each contract represents 100 shares
+
+                # Calculate P&L (zero when either side is unknown)
+                valid = (current > 0) & (entry > 0)
+                pnl_dollars = np.where(valid, current - entry, 0.0)
+                pnl_percent = np.divide(pnl_dollars, entry, out=np.zeros_like(entry), where=valid) * 100
+
+                for position_data, entry_price, current_price, pct, dollars in zip(
+                    result, entry.tolist(), current.tolist(), pnl_percent.tolist(), pnl_dollars.tolist()
+                ):
+                    position_data['entry_price'] = entry_price
+                    position_data['current_price'] = current_price
+                    position_data['pnl_percent'] = pct
+                    position_data['pnl_dollars'] = dollars
+                    logger.debug(
+                        "Found position: %s %s %s - %d contracts, Entry: $%.2f, Current: $%.2f (%+.2f%%)",
+                        position_data['ticker'], position_data['strike'], position_data['option_type'],
+                        position_data['contracts'], entry_price, current_price, pct
+                    )
+
             logger.info(f"📊 Total open positions: {len(result)}")
             return result
 
         except Exception as e:
             logger.error(f"Error fetching option positions: {e}")
+            self._check_auth_error(e)
             import traceback
             logger.exception("Full traceback:")
             return []
@@ -164,15 +338,15 @@ class Trader:
         """
         try:
             # Get current price
-            current_price = float(r.get_latest_price(ticker)[0])
-            logger.debug(f"Current price of {ticker}: ${current_price:.2f}")
+            current_price = _get_latest_price(ticker)
+            logger.debug("Current price of %s: $%.2f", ticker, current_price)
 
             # Determine option type (call or put) - works for both buying and selling
             option_type = "call" if decision in ["BUY_CALL", "SELL_CALL"] else "put"
 
             # Get expirations
-            chains = r.get_chains(ticker)
-            logger.debug(f"Chains data: {chains}")
+            chains = _get_chains(ticker)
+            logger.debug("Chains data: %s", chains)
 
             if not chains or 'expiration_dates' not in chains:
                 logger.error(f"No option chains found for {ticker}")
@@ -184,16 +358,13 @@ class Trader:
                 logger.error(f"No expiration dates found for {ticker}")
                 return None
 
-            logger.debug(f"Available expirations: {expirations}")
+            logger.debug("Available expirations: %s", expirations)
 
-            # Sort and pick one ~1 week out
-            valid_dates = [d for d in expirations if d > (datetime.date.today() + datetime.timedelta(days=7)).isoformat()]
-            if not valid_dates:
-                target_date = expirations[-1] # Fallback
-            else:
-                target_date = valid_dates[0]
+            # Pick one ~1 week out, falling back to the last expiration
+            cutoff = (datetime.date.today() + datetime.timedelta(days=7)).isoformat()
+            target_date = _first_expiration_after(expirations, cutoff)
 
-            logger.debug(f"Targeting expiration: {target_date}")
+            logger.debug("Targeting expiration: %s", target_date)
 
             options = r.find_options_by_expiration(ticker, target_date, optionType=option_type)
 
@@ -201,20 +372,14 @@ class Trader:
                 logger.error(f"No {option_type} options found for {ticker} expiring {target_date}")
                 return None
 
-            logger.debug(f"Found {len(options)} {option_type} options")
-
-            # Filter for strike near price
-            # Sort by distance from current price
-            options.sort(key=lambda x: abs(float(x['strike_price']) - current_price))
+            logger.debug("Found %d %s options", len(options), option_type)
 
-            # Select the closest one (ATM)
-            best_option = options[0]
-            logger.debug(f"📊 Selected option: Strike ${best_option['strike_price']} (closest to ${current_price:.2f})")
+            # Select the strike closest to the current price (ATM)
+            best_option = min(options, key=lambda x: abs(float(x['strike_price']) - current_price))
+            logger.debug("📊 Selected option: Strike $%s (closest to $%.2f)", best_option['strike_price'], current_price)
 
             # Get market data for this option to check liqudity/price
-            market_data = r.get_option_market_data_by_id(best_option['id'])
-            if isinstance(market_data, list):
-                market_data = market_data[0]
+            market_data = self._get_market_data([best_option['id']]).get(best_option['id'])
 
             ask_price = float(market_data['adjusted_mark_price']) # or ask_price
 
@@ -224,9 +389,9 @@ class Trader:
             # Round according to Robinhood rules to avoid subpenny increment errors
             limit_price = self.round_option_price(limit_price_raw)
 
-            logger.debug(f"💰 Market: ${ask_price:.2f}, Limit: ${limit_price:.2f} ({target_premium_pct*100:.0f}% of market)")
+            logger.debug("💰 Market: $%.2f, Limit: $%.2f (%.0f%% of market)", ask_price, limit_price, target_premium_pct * 100)
             if limit_price != limit_price_raw:
-                logger.debug(f"  Note: Rounded from ${limit_price_raw:.4f} to comply with Robinhood pricing rules")
+                logger.debug("  Note: Rounded from $%.4f to comply with Robinhood pricing rules", limit_price_raw)
 
             best_option['market_price'] = ask_price
             best_option['limit_price'] = limit_price
@@ -277,7 +442,7 @@ class Trader:
             # Check if order was placed successfully (simplified for demo)
             if order and 'id' in order:
                 logger.info(f"✅ Real limit order placed - ID: {order['id']}")
-                logger.debug(f"  Note: Order will fill when market reaches ${limit_price:.2f}")
+                logger.debug("  Note: Order will fill when market reaches $%.2f", limit_price)
                 # Add metadata for monitoring
                 order['option_id'] = option['id']
                 order['entry_price'] = limit_price  # Use limit price for monitoring
@@ -291,6 +456,7 @@ class Trader:
 
         except Exception as e:
             logger.error(f"Trade failed: {e}")
+            self._check_auth_error(e)
             return None
 
     def sell_option(self, trade_details):
@@ -324,7 +490,7 @@ class Trader:
                 return
 
             # Retrieve instrument details to be sure
-            inst = r.get_option_instrument_data_by_id(option_id)
+            inst = _get_instrument(option_id)
             symbol = inst['chain_symbol']
             expiration = inst['expiration_date']
             strike = inst['strike_price']
@@ -333,8 +499,7 @@ class Trader:
 
             # Sell Market/Limit
             # current market price for limit?
-            market_data = r.get_option_market_data_by_id(option_id)
-            if isinstance(market_data, list): market_data = market_data[0]
+            market_data = self._get_market_data([option_id]).get(option_id)
             bid_price = float(market_data['adjusted_mark_price']) # using mark as proxy or bid
 
             logger.info(f"💸 Placing sell order for {symbol} ${strike} {option_type}...")
@@ -352,6 +517,7 @@ class Trader:
             
         except Exception as e:
             logger.error(f"Sell failed: {e}")
+            self._check_auth_error(e)
 
     def find_spread_options(self, ticker, decision, budget=1000, target_premium_pct=1.0):
         """
@@ -360,60 +526,59 @@ class Trader:
         Returns None if unable to fetch spread options.
         """
         try:
-            current_price = float(r.get_latest_price(ticker)[0])
-            logger.debug(f"Current price of {ticker}: ${current_price:.2f}")
+            current_price = _get_latest_price(ticker)
+            logger.debug("Current price of %s: $%.2f", ticker, current_price)
 
             option_type = "call" if decision == "BULL_CALL_SPREAD" else "put"
 
             # Get expiration dates
-            chains = r.get_chains(ticker)
+            chains = _get_chains(ticker)
             if not chains or 'expiration_dates' not in chains:
                 logger.error(f"No option chains found for {ticker}")
                 return None
 
             expirations = chains['expiration_dates']
-            valid_dates = [d for d in expirations if d > (datetime.date.today() + datetime.timedelta(days=7)).isoformat()]
-            target_date = valid_dates[0] if valid_dates else expirations[-1]
+            cutoff = (datetime.date.today() + datetime.timedelta(days=7)).isoformat()
+            target_date = _first_expiration_after(expirations, cutoff)
 
-            logger.debug(f"Targeting expiration: {target_date}")
+            logger.debug("Targeting expiration: %s", target_date)
 
             options = r.find_options_by_expiration(ticker, target_date, optionType=option_type)
             if not options:
                 logger.error(f"No {option_type} options found")
                 return None
 
-            # Sort by strike
-            options.sort(key=lambda x: float(x['strike_price']))
+            # Parse strikes once
+            strikes = np.fromiter((float(o['strike_price']) for o in options), dtype=np.float64, count=len(options))
 
             # Find strikes for spread
             # Bull Call Spread: Buy lower strike call, Sell higher strike call
             # Bear Put Spread: Buy higher strike put, Sell lower strike put
+            is_bull = decision == "BULL_CALL_SPREAD"
 
-            if decision == "BULL_CALL_SPREAD":
+            if is_bull:
                 # Find ATM or slightly ITM call for long leg
-                long_options = [o for o in options if float(o['strike_price']) <= current_price * 1.02]
-                short_options = [o for o in options if float(o['strike_price']) >= current_price * 1.08]
+                long_mask = strikes <= current_price * 1.02
+                short_mask = strikes >= current_price * 1.08
             else:  # BEAR_PUT_SPREAD
                 # Find ATM or slightly ITM put for long leg
-                long_options = [o for o in options if float(o['strike_price']) >= current_price * 0.98]
-                short_options = [o for o in options if float(o['strike_price']) <= current_price * 0.92]
+                long_mask = strikes >= current_price * 0.98
+                short_mask = strikes <= current_price * 0.92
 
-            if not long_options or not short_options:
+            if not long_mask.any() or not short_mask.any():
                 logger.error("Could not find suitable strikes for spread")
                 return None
 
-            # Select strikes (closest to target criteria)
-            long_option = long_options[-1] if decision == "BULL_CALL_SPREAD" else long_options[0]
-            short_option = short_options[0] if decision == "BULL_CALL_SPREAD" else short_options[-1]
+            # Select strikes (closest to target criteria): the qualifying strike nearest the money
+            long_strikes = np.where(long_mask, strikes, np.nan)
+            short_strikes = np.where(short_mask, strikes, np.nan)
+            long_option = options[int(np.nanargmax(long_strikes) if is_bull else np.nanargmin(long_strikes))]
+            short_option = options[int(np.nanargmin(short_strikes) if is_bull else np.nanargmax(short_strikes))]
 
-            # Get market prices
-            long_market_data = r.get_option_market_data_by_id(long_option['id'])
-            short_market_data = r.get_option_market_data_by_id(short_option['id'])
-
-            if isinstance(long_market_data, list):
-                long_market_data = long_market_data[0]
-            if isinstance(short_market_data, list):
-                short_market_data = short_market_data[0]
+            # Get market prices for both legs in one request
+            leg_market_data = self._get_market_data([long_option['id'], short_option['id']])
+            long_market_data = leg_market_data.get(long_option['id'])
+            short_market_data = leg_market_data.get(short_option['id'])
 
             long_price = float(long_market_data['adjusted_mark_price'])
             short_price = float(short_market_data['adjusted_mark_price'])
@@ -426,7 +591,7 @@ class Trader:
             max_profit = abs(short_strike - long_strike) - net_debit
 
             logger.info(f"📈 Spread setup: Long ${long_strike} @ ${long_price:.2f}, Short ${short_strike} @ ${short_price:.2f}")
-            logger.debug(f"Net debit: ${net_debit:.2f}, Limit: ${limit_price:.2f}, Max profit: ${max_profit:.2f}")
+            logger.debug("Net debit: $%.2f, Limit: $%.2f, Max profit: $%.2f", net_debit, limit_price, max_profit)
 
             return {
                 "type": decision,
@@ -465,44 +630,38 @@ class Trader:
         Returns None if unable to fetch straddle options.
         """
         try:
-            current_price = float(r.get_latest_price(ticker)[0])
-            logger.debug(f"Current price of {ticker}: ${current_price:.2f}")
+            current_price = _get_latest_price(ticker)
+            logger.debug("Current price of %s: $%.2f", ticker, current_price)
 
             # Get expiration dates
-            chains = r.get_chains(ticker)
+            chains = _get_chains(ticker)
             if not chains or 'expiration_dates' not in chains:
                 logger.error(f"No option chains found for {ticker}")
                 return None
 
             expirations = chains['expiration_dates']
-            valid_dates = [d for d in expirations if d > (datetime.date.today() + datetime.timedelta(days=21)).isoformat()]
-            target_date = valid_dates[0] if valid_dates else expirations[-1]
+            cutoff = (datetime.date.today() + datetime.timedelta(days=21)).isoformat()
+            target_date = _first_expiration_after(expirations, cutoff)
 
-            logger.debug(f"Targeting expiration: {target_date}")
+            logger.debug("Targeting expiration: %s", target_date)
 
-            # Get ATM calls and puts
-            call_options = r.find_options_by_expiration(ticker, target_date, optionType="call")
+            # Get ATM calls and puts (both chains fetched concurrently)
+            call_future = self._lookup_pool.submit(r.find_options_by_expiration, ticker, target_date, optionType="call")
             put_options = r.find_options_by_expiration(ticker, target_date, optionType="put")
+            call_options = call_future.result()
 
             if not call_options or not put_options:
                 logger.error("Could not find call or put options")
                 return None
 
             # Find ATM strike (closest to current price)
-            call_options.sort(key=lambda x: abs(float(x['strike_price']) - current_price))
-            put_options.sort(key=lambda x: abs(float(x['strike_price']) - current_price))
-
-            atm_call = call_options[0]
-            atm_put = put_options[0]
-
-            # Get market prices
-            call_market_data = r.get_option_market_data_by_id(atm_call['id'])
-            put_market_data = r.get_option_market_data_by_id(atm_put['id'])
+            atm_call = min(call_options, key=lambda x: abs(float(x['strike_price']) - current_price))
+            atm_put = min(put_options, key=lambda x: abs(float(x['strike_price']) - current_price))
 
-            if isinstance(call_market_data, list):
-                call_market_data = call_market_data[0]
-            if isinstance(put_market_data, list):
-                put_market_data = put_market_data[0]
+            # Get market prices for both legs in one request
+            leg_market_data = self._get_market_data([atm_call['id'], atm_put['id']])
+            call_market_data = leg_market_data.get(atm_call['id'])
+            put_market_data = leg_market_data.get(atm_put['id'])
 
             call_price = float(call_market_data['adjusted_mark_price'])
             put_price = float(put_market_data['adjusted_mark_price'])
@@ -515,8 +674,8 @@ class Trader:
             breakeven_down = strike - total_debit
 
             logger.info(f"📊 Straddle setup: Strike ${strike}, Call @ ${call_price:.2f}, Put @ ${put_price:.2f}")
-            logger.debug(f"Total debit: ${total_debit:.2f}, Limit: ${limit_price:.2f}")
-            logger.debug(f"Breakevens: ${breakeven_down:.2f} / ${breakeven_up:.2f}")
+            logger.debug("Total debit: $%.2f, Limit: $%.2f", total_debit, limit_price)
+            logger.debug("Breakevens: $%.2f / $%.2f", breakeven_down, breakeven_up)
 
             return {
                 "type": "STRADDLE",
@@ -12,6 +12,15 @@ from pathlib import Path
 
 DB_PATH = "data/trading.db"
 
+INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_positions_user_id ON positions(user_id);
+DROP INDEX IF EXISTS idx_positions_user_status;
+CREATE INDEX IF NOT EXISTS idx_positions_open ON positions(user_id, created_at DESC) WHERE status = 'open';
+CREATE INDEX IF NOT EXISTS idx_trades_user_id ON trades(user_id);
+CREATE INDEX IF NOT EXISTS idx_trades_user_created ON trades(user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_settings_user_id ON settings(user_id);
+"""
+
 
 def migrate():
     """Add user_id column to positions and trades tables if it doesn't exist"""
@@ -22,44 +31,39 @@ def migrate():
         print("   No migration needed - database will be created with correct schema on first run.")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    # Autocommit mode: the transaction is opened and committed by the DDL script itself
+    # (executescript() would commit any transaction opened outside it first)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
     cursor = conn.cursor()
 
     try:
-        # Check if user_id column exists in positions table
-        cursor.execute("PRAGMA table_info(positions)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if 'user_id' not in columns:
-            print("📝 Adding user_id column to positions table...")
-            cursor.execute("ALTER TABLE positions ADD COLUMN user_id TEXT NOT NULL DEFAULT 'default_user'")
-            print("✅ Added user_id column to positions")
-        else:
-            print("✓ user_id column already exists in positions")
-
-        # Check if user_id column exists in trades table
-        cursor.execute("PRAGMA table_info(trades)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if 'user_id' not in columns:
-            print("📝 Adding user_id column to trades table...")
-            cursor.execute("ALTER TABLE trades ADD COLUMN user_id TEXT NOT NULL DEFAULT 'default_user'")
-            print("✅ Added user_id column to trades")
-        else:
-            print("✓ user_id column already exists in trades")
+        # Same journal settings as the app (journal_mode can't change inside a transaction)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
+        # Check which tables still need the user_id column
+        ddl = []
+        for table in ("positions", "trades"):
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in cursor.fetchall()]
+
+            if 'user_id' not in columns:
+                print(f"📝 Adding user_id column to {table} table...")
+                ddl.append(f"ALTER TABLE {table} ADD COLUMN user_id TEXT NOT NULL DEFAULT 'default_user';")
+            else:
+                print(f"✓ user_id column already exists in {table}")
 
         # Create indexes
         print("📝 Creating indexes...")
-        try:
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_user_id ON positions(user_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_user_status ON positions(user_id, status)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_user_id ON trades(user_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_settings_user_id ON settings(user_id)")
-            print("✅ Indexes created")
-        except Exception as e:
-            print(f"⚠️  Index creation warning: {e}")
-
-        conn.commit()
+        ddl.append(INDEX_DDL)
+
+        # Apply all schema changes in one write transaction, as one script
+        conn.executescript("BEGIN IMMEDIATE;\n" + "\n".join(ddl) + "\nCOMMIT;")
+
+        # Gather statistics so the planner picks the new user_id indexes right away
+        print("📝 Analyzing tables...")
+        cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA optimize")
         print("✅ Migration complete!")
 
     except Exception as e: